@@ -0,0 +1,60 @@
+"""
+AIMD concurrency controller for async request fanouts
+
+Additive-increase / multiplicative-decrease: every `window` completed
+requests, concurrency grows by alpha if they were all fast and unthrottled,
+and shrinks by a factor of beta if any was throttled (429/5xx) or the mean
+latency exceeded the target. Waiting workers are woken as soon as the limit
+changes, so no polling is involved.
+
+Usage Example:
+    from _aimd import AIMDController
+
+    controller = AIMDController()
+    await controller.acquire()
+    started = time.monotonic()
+    ...  # issue the request
+    await controller.release(time.monotonic() - started, throttled=False)
+"""
+
+import asyncio
+
+
+class AIMDController:
+    """Adaptive concurrency limit shared by the workers of one fanout."""
+
+    def __init__(self, initial=4, minimum=1, maximum=32, target_latency=0.5,
+                 alpha=0.5, beta=0.5, window=4):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.alpha = alpha
+        self.beta = beta
+        self.window = window
+        self._active = 0
+        self._latencies = []
+        self._throttled = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        """Wait until fewer than int(limit) requests are in flight."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < int(self.limit))
+            self._active += 1
+
+    async def release(self, latency, throttled=False):
+        """Record a finished request and adjust the limit once per window."""
+        async with self._condition:
+            self._active -= 1
+            self._latencies.append(latency)
+            self._throttled += bool(throttled)
+            if len(self._latencies) >= self.window:
+                mean = sum(self._latencies) / len(self._latencies)
+                if self._throttled or mean > self.target_latency:
+                    self.limit = max(self.minimum, self.limit * self.beta)
+                else:
+                    self.limit = min(self.maximum, self.limit + self.alpha)
+                self._latencies.clear()
+                self._throttled = 0
+            self._condition.notify_all()
@@ -0,0 +1,75 @@
+"""
+Retry decorator with exponential backoff, jitter and Retry-After support
+
+Only transient failures are retried: HTTP 429/500/502/503/504 and
+connection errors or timeouts. Other 4xx responses fail immediately, since
+repeating a bad request cannot succeed.
+
+Usage Example:
+    from _backoff import backoff_retry
+
+    @backoff_retry(max_tries=5)
+    def fetch():
+        response = session.get(url, timeout=15)
+        response.raise_for_status()
+        return response.json()
+"""
+
+import functools
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_after_seconds(response):
+    """Parse a Retry-After header given as seconds or an HTTP date; 0 if absent."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _is_retryable(error):
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code in RETRYABLE_STATUS
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def backoff_retry(max_tries=5, base=0.5, max_delay=30):
+    """
+    Retry the wrapped call on transient HTTP failures.
+
+    Args:
+        max_tries (int): Total attempts including the first
+        base (float): Initial delay in seconds, doubled after each attempt
+        max_delay (float): Upper bound on any single sleep, in seconds
+
+    Returns:
+        A decorator; the wrapped function re-raises the last error once
+        attempts are exhausted or the error is not retryable.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_tries):
+                try:
+                    return fn(*args, **kwargs)
+                except requests.exceptions.RequestException as e:
+                    if attempt == max_tries - 1 or not _is_retryable(e):
+                        raise
+                    delay = base * 2 ** attempt + random.uniform(0, 0.5)
+                    delay = max(_retry_after_seconds(getattr(e, "response", None)), delay)
+                    time.sleep(min(delay, max_delay))
+        return wrapper
+    return decorator
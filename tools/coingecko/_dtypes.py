@@ -0,0 +1,47 @@
+"""
+DataFrame memory reduction helpers
+
+Shared by the CoinGecko and DeFiLlama tools so the frames they return use
+consistent, compact dtypes.
+
+Usage Example:
+    from _dtypes import reduce_memory
+
+    df = reduce_memory(df, float32_cols=['change1d', 'change30d'])
+"""
+
+import pandas as pd
+
+
+def reduce_memory(df, float32_cols=(), category_ratio=0.5):
+    """
+    Downcast a DataFrame's dtypes in place and return it.
+
+    Integer columns are downcast to the smallest integer type that fits.
+    Only the float columns named in float32_cols become float32; other
+    floats stay float64, because prices and volumes need more than
+    float32's ~7 significant digits. String columns become category when
+    their unique count is below category_ratio of the row count, the point
+    where the codes plus categories are smaller than the strings.
+
+    Args:
+        df (pandas.DataFrame): Frame to shrink
+        float32_cols (iterable of str): Float columns safe to store as float32
+        category_ratio (float): Maximum unique/rows ratio for category conversion
+
+    Returns:
+        pandas.DataFrame: The same frame with reduced dtypes
+    """
+    for col in df.select_dtypes('integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    float32_cols = [c for c in float32_cols if c in df and pd.api.types.is_float_dtype(df[c])]
+    if float32_cols:
+        df[float32_cols] = df[float32_cols].astype('float32')
+    for col in df.select_dtypes(['object', 'string']).columns:
+        try:
+            unique = df[col].nunique()
+        except TypeError:
+            continue  # nested dicts/lists (e.g. roi, sparkline) are unhashable
+        if unique < len(df) * category_ratio:
+            df[col] = df[col].astype('category')
+    return df
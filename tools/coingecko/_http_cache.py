@@ -0,0 +1,103 @@
+"""
+On-disk TTL cache for JSON HTTP responses
+
+Shared by the CoinGecko and DeFiLlama tools, whose upstream data only
+refreshes every few minutes (markets) to hourly (DEX overview). Responses
+are stored as .cache/<prefix>/<md5 of url+params>.json under the project
+root, holding {"ts": <fetch time>, "body": <parsed JSON>}. Bodies are
+decoded with orjson when it is installed.
+
+Usage Example:
+    from _http_cache import cached_get
+
+    data = cached_get(session, url, params={"page": 1}, ttl=300, prefix="coingecko")
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+CACHE_ROOT = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')), '.cache')
+
+
+def _cache_path(url, params, prefix):
+    key = hashlib.md5((url + json.dumps(params or {}, sort_keys=True)).encode()).hexdigest()
+    return os.path.join(CACHE_ROOT, prefix, f"{key}.json")
+
+
+@functools.lru_cache(maxsize=128)
+def _read(path, mtime):
+    """Read a cache file's bytes; keyed on mtime so a rewrite invalidates the in-process copy."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _load(path, mtime):
+    """Parse a cache file. Only the bytes are memoized, so each caller gets its own objects."""
+    raw = _read(path, mtime)
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _store(path, entry):
+    """Write entry atomically so concurrent readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def cached_get(session, url, params=None, headers=None, ttl=300, prefix="http", timeout=15, limiter=None):
+    """
+    GET url and return the parsed JSON body, serving from cache when fresh.
+
+    Args:
+        session (requests.Session): Session used on a cache miss
+        url (str): Request URL
+        params (dict, optional): Query parameters (part of the cache key)
+        headers (dict, optional): Request headers (not part of the cache key)
+        ttl (float): Seconds a cached body stays valid
+        prefix (str): Cache subdirectory, usually the provider name
+        timeout (float): Request timeout in seconds
+        limiter (RateLimiter, optional): Throttles requests on a cache miss
+
+    Returns:
+        The decoded JSON body
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+        ValueError: If the response body is not valid JSON
+    """
+    path = _cache_path(url, params, prefix)
+    try:
+        entry = _load(path, os.stat(path).st_mtime_ns)
+        if time.time() - entry["ts"] < ttl:
+            return entry["body"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    if limiter is not None:
+        limiter.wait_if_throttled()
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+    if limiter is not None:
+        limiter.observe(response.headers)
+    response.raise_for_status()
+    body = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    try:
+        _store(path, {"ts": time.time(), "body": body})
+    except OSError:
+        # Caching is best effort; a read-only filesystem should not fail the call
+        pass
+    return body
@@ -0,0 +1,63 @@
+"""
+Sliding-window requests-per-minute limiter
+
+Spreads calls to stay under a provider's RPM limit instead of bursting
+into 429 responses and backing off. One limiter instance is shared by all
+callers of a provider within the process.
+
+Usage Example:
+    from _ratelimit import RateLimiter
+
+    limiter = RateLimiter(rpm=500)
+    limiter.wait_if_throttled()
+    response = session.get(url)
+    limiter.observe(response.headers)
+"""
+
+import threading
+import time
+from collections import deque
+
+WINDOW = 60.0  # seconds
+
+
+class RateLimiter:
+    """Block callers so that at most rpm requests start in any 60 s window."""
+
+    def __init__(self, rpm):
+        self.rpm = rpm
+        self._window = deque()
+        self._lock = threading.Lock()
+
+    def wait_if_throttled(self):
+        """Record a request, first sleeping until the window has room for it."""
+        with self._lock:
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= WINDOW:
+                self._window.popleft()
+            if len(self._window) >= self.rpm:
+                time.sleep(WINDOW - (now - self._window[0]))
+                self._window.popleft()
+                now = time.monotonic()
+            self._window.append(now)
+
+    def observe(self, headers):
+        """
+        Pause when response headers say the server-side budget is nearly spent.
+
+        Reads x-ratelimit-remaining-requests and sleeps for retry-after
+        (default 1 s) once at most 2 requests or 10% of the limit remain.
+        """
+        remaining = headers.get("x-ratelimit-remaining-requests")
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+        if remaining <= max(2, self.rpm // 10):
+            try:
+                delay = float(headers.get("retry-after", 1))
+            except ValueError:
+                delay = 1.0
+            time.sleep(delay)
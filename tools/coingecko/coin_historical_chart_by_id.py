@@ -26,6 +26,9 @@ import json
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 load_dotenv(os.path.join(project_root, '.env'))
 
+# Shared session so repeated calls (e.g. several ranges of one coin) reuse keep-alive connections
+_SESSION = requests.Session()
+
 def get_coin_historical_chart_by_id(coin_id, vs_currency='usd', days=30, interval=None):
     """
     Fetch historical chart data for a specific coin by its id from CoinGecko.
@@ -52,7 +55,7 @@ def get_coin_historical_chart_by_id(coin_id, vs_currency='usd', days=30, interva
     headers = {"x-cg-pro-api-key": os.getenv("COINGECKO_API_KEY")}
     for _ in range(3):
         try:
-            resp = requests.get(url, params=params, headers=headers, timeout=15)
+            resp = _SESSION.get(url, params=params, headers=headers, timeout=15)
             resp.raise_for_status()
             return resp.json()
         except Exception:
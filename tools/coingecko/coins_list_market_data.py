@@ -11,22 +11,90 @@ Usage Example:
     df = get_coins_list_market_data(vs_currency='usd', per_page=10)
     print(df.head())
 
+    # Fetch several pages concurrently (requires aiohttp)
+    import asyncio
+    from tools.coins_list_market_data import get_coins_list_market_data_async
+    df = asyncio.run(get_coins_list_market_data_async(pages=range(1, 5), per_page=250))
+
 Returns:
     pandas.DataFrame with market data for coins
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import os
-from dotenv import load_dotenv
+import sys
 import time
+from dotenv import load_dotenv
 import argparse
 import json
+from _http_cache import cached_get
+from _backoff import backoff_retry, RETRYABLE_STATUS
+from _ratelimit import RateLimiter
+from _aimd import AIMDController
+from _dtypes import reduce_memory
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Load environment variables from project root directory
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 load_dotenv(os.path.join(project_root, '.env'))
 
+MARKETS_URL = "https://pro-api.coingecko.com/api/v3/coins/markets"
+# Built once at import, after .env is loaded; set COINGECKO_API_KEY before importing
+_COINGECKO_HEADERS = {"x-cg-pro-api-key": os.getenv("COINGECKO_API_KEY")}
+# Market data refreshes every few minutes, so identical requests are served from disk
+MARKETS_CACHE_TTL = 300  # seconds
+MAX_CONCURRENT_PAGES = 32  # ceiling for the adaptive async pagination concurrency
+MAX_PAGE_ATTEMPTS = 3
+COINGECKO_RPM = 500  # CoinGecko Pro requests-per-minute limit
+
+# Shared across callers in this process so bursts are spread under the RPM limit
+_LIMITER = RateLimiter(COINGECKO_RPM)
+
+# Shared session so repeated calls (pagination, polling) reuse keep-alive connections.
+# Retries are handled by backoff_retry, which honors Retry-After and skips 4xx errors.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+def _market_params(vs_currency, order, per_page, page, sparkline, price_change_percentage):
+    """Build the /coins/markets query parameters."""
+    params = {
+        'vs_currency': vs_currency,
+        'order': order,
+        'per_page': per_page,
+        'page': page,
+        'sparkline': str(sparkline).lower()
+    }
+    if price_change_percentage:
+        params['price_change_percentage'] = price_change_percentage
+    return params
+
+@backoff_retry(max_tries=5, base=0.5, max_delay=30)
+def _fetch_markets(params, headers):
+    """GET /coins/markets, retrying transient failures with exponential backoff."""
+    return cached_get(_SESSION, MARKETS_URL, params=params, headers=headers,
+                      ttl=MARKETS_CACHE_TTL, prefix="coingecko", limiter=_LIMITER)
+
+def _fetch_markets_raw(vs_currency='usd', order='market_cap_desc', per_page=100, page=1, sparkline=False, price_change_percentage=None):
+    """Fetch /coins/markets as parsed JSON (list of dicts), without building a DataFrame."""
+    params = _market_params(vs_currency, order, per_page, page, sparkline, price_change_percentage)
+    try:
+        return _fetch_markets(params, _COINGECKO_HEADERS)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        raise ConnectionError("API request failed after retries") from e
+
 def get_coins_list_market_data(vs_currency='usd', order='market_cap_desc', per_page=100, page=1, sparkline=False, price_change_percentage=None):
     """
     Fetch a list of coins with market data from CoinGecko.
@@ -45,30 +113,97 @@ def get_coins_list_market_data(vs_currency='usd', order='market_cap_desc', per_p
     Raises:
         ConnectionError: If API request fails after retries
     """
-    url = "https://pro-api.coingecko.com/api/v3/coins/markets"
-    params = {
-        'vs_currency': vs_currency,
-        'order': order,
-        'per_page': per_page,
-        'page': page,
-        'sparkline': str(sparkline).lower()
-    }
-    if price_change_percentage:
-        params['price_change_percentage'] = price_change_percentage
-    headers = {"x-cg-pro-api-key": os.getenv("COINGECKO_API_KEY")}
-    for _ in range(3):
-        try:
-            resp = requests.get(url, params=params, headers=headers, timeout=15)
-            resp.raise_for_status()
-            data = resp.json()
-            return pd.DataFrame(data)
-        except Exception:
-            time.sleep(1)
-    raise ConnectionError("API request failed after retries")
+    data = _fetch_markets_raw(vs_currency, order, per_page, page, sparkline, price_change_percentage)
+    return _compact_dtypes(pd.DataFrame.from_records(data))
+
+def _compact_dtypes(df):
+    """
+    Shrink the markets frame without losing precision where it matters.
+    
+    Percentage columns become float32 and integer columns are downcast;
+    prices, caps, volumes and supplies stay float64 (see reduce_memory).
+    id/symbol/name are unique per coin, so they usually stay strings.
+    """
+    pct_cols = [c for c in df.columns if 'percentage' in c]
+    reduce_memory(df, float32_cols=pct_cols)
+    if 'market_cap_rank' in df:
+        # Float when the page has unranked coins; downcast only if all integral
+        df['market_cap_rank'] = pd.to_numeric(df['market_cap_rank'], downcast='integer')
+    return df
+
+async def _fetch_page(session, params, headers):
+    """Fetch one /coins/markets page on an aiohttp session."""
+    async with session.get(MARKETS_URL, params=params, headers=headers,
+                           timeout=aiohttp.ClientTimeout(total=15)) as resp:
+        resp.raise_for_status()
+        return await resp.json()
+
+async def get_coins_list_market_data_async(pages=range(1, 5), vs_currency='usd', order='market_cap_desc', per_page=250, sparkline=False, price_change_percentage=None):
+    """
+    Fetch several pages of market data concurrently and concatenate them.
+    
+    Pages are served from a queue by workers whose concurrency is tuned
+    with AIMD: it grows while requests stay under 500 ms and halves on
+    429/5xx responses (which are requeued) or slow windows.
+    
+    Args:
+        pages (iterable of int): Page numbers to fetch (default: 1-4)
+        vs_currency, order, per_page, sparkline, price_change_percentage:
+            Same as get_coins_list_market_data
+    
+    Returns:
+        pandas.DataFrame: Rows from all pages, in page order
+    
+    Raises:
+        ImportError: If aiohttp is not installed
+        ConnectionError: If any page request fails
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("aiohttp is required for get_coins_list_market_data_async - pip install aiohttp")
+    queue = asyncio.Queue()
+    for index, page in enumerate(pages):
+        queue.put_nowait((index, _market_params(vs_currency, order, per_page, page, sparkline, price_change_percentage), 1))
+    results = [None] * queue.qsize()
+    # Concurrency starts at 4 and adapts to observed latency and throttling
+    controller = AIMDController(initial=4, minimum=1, maximum=MAX_CONCURRENT_PAGES, target_latency=0.5)
+
+    async def worker(session):
+        while True:
+            try:
+                index, params, attempt = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await controller.acquire()
+            started = time.monotonic()
+            throttled = False
+            try:
+                results[index] = await _fetch_page(session, params, _COINGECKO_HEADERS)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRYABLE_STATUS or attempt >= MAX_PAGE_ATTEMPTS:
+                    raise
+                throttled = True
+                queue.put_nowait((index, params, attempt + 1))
+            finally:
+                await controller.release(time.monotonic() - started, throttled)
+
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_PAGES, keepalive_timeout=60)
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(min(len(results), MAX_CONCURRENT_PAGES))]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for task in workers:
+                    task.cancel()
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        raise ConnectionError(f"API request failed: {e}") from e
+    if not results:
+        return pd.DataFrame()
+    return _compact_dtypes(pd.concat([pd.DataFrame.from_records(data) for data in results], ignore_index=True, copy=False))
 
 if __name__ == "__main__":
     # This block allows the script to be run directly from the command line.
-    # It parses command-line arguments and calls get_coins_list_market_data with those arguments.
+    # It parses command-line arguments and fetches market data with those arguments.
     # Example usage:
     #   python coins_list_market_data.py --vs_currency usd --per_page 10
     #   python coins_list_market_data.py --vs_currency usd --order market_cap_desc --per_page 50 --output_format json
@@ -84,8 +219,8 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     try:
-        # Call the main function to fetch market data using the provided arguments
-        data = get_coins_list_market_data(
+        # Fetch raw records; a DataFrame is only built when CSV output needs one
+        records = _fetch_markets_raw(
             vs_currency=args.vs_currency,
             order=args.order,
             per_page=args.per_page,
@@ -94,11 +229,15 @@ if __name__ == "__main__":
             price_change_percentage=args.price_change_percentage
         )
         
-        # Output in the specified format
+        # Output in the specified format, writing straight to stdout
         if args.output_format == 'json':
-            print(json.dumps(data.to_dict('records'), ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+            else:
+                json.dump(records, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
-            print(data.to_csv(index=False))
+            pd.DataFrame.from_records(records).to_csv(sys.stdout, index=False)
             
     except Exception as e:
         # Print error message if the API call fails
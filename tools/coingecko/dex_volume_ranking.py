@@ -14,8 +14,8 @@ Environment Variables Required:
 - None (DeFiLlama API is free and doesn't require API keys)
 
 API/Service Limitations:
-- Rate limits: Standard HTTP rate limits apply
-- Data updates: Every hour
+- Rate limits: Standard HTTP rate limits apply (429/5xx are retried with backoff)
+- Data updates: Every hour (responses are cached on disk for the same period)
 - Free API access without authentication
 
 Usage Example:
@@ -28,10 +28,15 @@ Usage Example:
     result = get_dex_volume_ranking(5)
 """
 
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any
 from dotenv import load_dotenv
+from _http_cache import cached_get
+from _dtypes import reduce_memory
 
 # Load environment variables
 load_dotenv()
@@ -39,7 +44,23 @@ load_dotenv()
 # API Configuration
 API_BASE_URL = "https://api.llama.fi"
 DEX_OVERVIEW_ENDPOINT = "/overview/dexs"
+DEX_OVERVIEW_URL = f"{API_BASE_URL}{DEX_OVERVIEW_ENDPOINT}"
 REQUEST_TIMEOUT = 15
+CACHE_TTL = 3600  # seconds; DeFiLlama updates the overview hourly
+
+# DeFiLlama protocol fields with their defaults, and their output column names
+_PROTOCOL_FIELDS = {'name': 'Unknown', 'total24h': 0, 'total30d': 0, 'change_1d': 0, 'change_1m': 0}
+_PROTOCOL_RENAMES = {'total24h': 'total1d', 'change_1d': 'change1d', 'change_1m': 'change30d'}
+
+# Shared session so repeated calls reuse keep-alive connections;
+# Retry backs off exponentially on transient errors and honors Retry-After
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                      respect_retry_after_header=True),
+))
 
 
 def get_dex_volume_ranking(n: int) -> pd.DataFrame:
@@ -130,32 +151,26 @@ def _validate_input(n: int) -> None:
 
 def _fetch_dex_data() -> Dict[str, Any]:
     """Fetch DEX volume data from DeFiLlama API."""
-    url = f"{API_BASE_URL}{DEX_OVERVIEW_ENDPOINT}"
-    
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = cached_get(_SESSION, DEX_OVERVIEW_URL, ttl=CACHE_TTL, prefix="defillama", timeout=REQUEST_TIMEOUT)
         if not data:
             raise ValueError("API returned empty response")
         
         return data
         
+    except json.JSONDecodeError:
+        # orjson's and requests' decode errors both subclass json.JSONDecodeError
+        raise ConnectionError("Invalid JSON response from API")
     except requests.exceptions.Timeout:
         raise ConnectionError("Request timeout - API may be slow")
     except requests.exceptions.HTTPError as e:
         raise ConnectionError(f"HTTP error: {e}")
     except requests.exceptions.RequestException as e:
         raise ConnectionError(f"Request failed: {e}")
-    except ValueError as e:
-        if "JSON" in str(e):
-            raise ConnectionError("Invalid JSON response from API")
-        raise
 
 
-def _process_dex_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Process raw API data into structured format."""
+def _process_dex_data(data: Dict[str, Any]) -> pd.DataFrame:
+    """Process raw API data into a DataFrame of DEXes with positive 24h volume."""
     if not isinstance(data, dict):
         raise ValueError("Invalid data format from API")
     
@@ -164,54 +179,42 @@ def _process_dex_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not protocols:
         raise ValueError("No DEX data found in API response")
     
-    processed_data = []
-    for protocol in protocols:
-        if not isinstance(protocol, dict):
-            continue
-            
-        # Extract required fields with defaults
-        dex_info = {
-            'name': protocol.get('name', 'Unknown'),
-            'total1d': protocol.get('total24h', 0),
-            'total30d': protocol.get('total30d', 0),
-            'change1d': protocol.get('change_1d', 0),
-            'change30d': protocol.get('change_1m', 0)
-        }
-        
-        # Only include DEXes with valid volume data
-        if dex_info['total1d'] > 0:
-            processed_data.append(dex_info)
+    # Build all rows in one columnar pass, filling missing fields with defaults
+    df = pd.DataFrame.from_records([p for p in protocols if isinstance(p, dict)])
+    df = df.reindex(columns=list(_PROTOCOL_FIELDS)).fillna(_PROTOCOL_FIELDS)
+    df = df.rename(columns=_PROTOCOL_RENAMES)
     
-    if not processed_data:
+    # Only include DEXes with valid volume data
+    df = df[df['total1d'] > 0]
+    
+    if df.empty:
         raise ValueError("No valid DEX data found")
     
-    return processed_data
+    return df
 
 
-def _get_top_n_dexes(data: List[Dict[str, Any]], n: int) -> pd.DataFrame:
+def _get_top_n_dexes(data: pd.DataFrame, n: int) -> pd.DataFrame:
     """Get top N DEXes sorted by 24-hour volume."""
-    # Sort by 24-hour volume (descending)
-    sorted_data = sorted(data, key=lambda x: x['total1d'], reverse=True)
-    
-    # Take top N
-    top_n = sorted_data[:n]
+    # Partial sort: only the top N rows by 24-hour volume are ordered
+    df = data.nlargest(n, 'total1d').reset_index(drop=True)
     
-    if len(top_n) < n:
-        available = len(top_n)
+    if len(df) < n:
+        available = len(df)
         print(f"Warning: Only {available} DEXes available, returning all")
     
-    # Convert to DataFrame
-    df = pd.DataFrame(top_n)
-    
     # Add ranking column
     df.insert(0, 'rank', range(1, len(df) + 1))
     
-    return df
+    # Volumes are pinned to float64 so frames from different calls concat cleanly;
+    # percentage changes fit in float32
+    df[['total1d', 'total30d']] = df[['total1d', 'total30d']].astype('float64')
+    return reduce_memory(df, float32_cols=['change1d', 'change30d'])
 
 
 if __name__ == "__main__":
     """Command-line interface for testing."""
     import argparse
+    import sys
     
     parser = argparse.ArgumentParser(description="Get DEX volume rankings")
     parser.add_argument(
@@ -241,9 +244,10 @@ if __name__ == "__main__":
                 'change30d': '{:+.1f}%'.format
             }))
         elif args.format == "json":
-            print(result.to_json(indent=2))
+            result.to_json(sys.stdout, indent=2)
+            sys.stdout.write("\n")
         elif args.format == "csv":
-            print(result.to_csv(index=False))
+            result.to_csv(sys.stdout, index=False)
             
     except Exception as e:
         print(f"Error: {e}")
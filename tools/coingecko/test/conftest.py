@@ -0,0 +1,95 @@
+"""
+Shared pytest configuration for CoinGecko tool tests
+
+Tests marked 'network' call the live CoinGecko API. Each one is an
+independent HTTPS round-trip, so they parallelize well with pytest-xdist:
+
+    pytest tools/coingecko/test -n auto --dist=loadfile -m network
+
+--dist=loadfile keeps each module on one worker, so tests that share
+module-level state still see it.
+
+Their HTTP traffic is recorded once to fixtures/<module>/<test>.json and
+replayed with the responses library on later runs, so the real request and
+parsing code runs without touching the API. Pass --refresh-fixtures to
+record again. Tests whose requests change every run (e.g. "the last 7
+days") are also marked 'live' and always call the API. Only status,
+content type and body are stored, never headers, so the API key does not
+end up in a fixture.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import requests
+import responses
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+# Diagnostic scripts, not tests: they call the API (and print the key) at import
+# time, which collection would repeat once per xdist worker
+collect_ignore = ["test_volume_data_direct.py", "test_coingecko_api_key_check.py"]
+
+
+def pytest_addoption(parser):
+    parser.addoption("--refresh-fixtures", action="store_true",
+                     help="Ignore recorded HTTP fixtures and call the live API again")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: test calls the live CoinGecko API")
+    config.addinivalue_line("markers", "live: network test never served from recorded fixtures")
+
+
+def _replay(path):
+    """Serve every recorded exchange in path; query strings must match exactly."""
+    rsps = responses.RequestsMock(assert_all_requests_are_fired=False)
+    for entry in json.loads(path.read_text()):
+        rsps.add(entry["method"], entry["url"], body=entry["body"], status=entry["status"],
+                 content_type=entry["content_type"])
+    return rsps
+
+
+@pytest.fixture(autouse=True)
+def http_fixture(request, monkeypatch):
+    """Record a network test's HTTP exchanges on first run, replay them afterwards."""
+    if "network" not in request.keywords or "live" in request.keywords:
+        yield
+        return
+    path = FIXTURE_DIR / request.module.__name__ / f"{request.node.name}.json"
+    if path.exists() and not request.config.getoption("--refresh-fixtures"):
+        with _replay(path):
+            yield
+        return
+
+    recorded = []
+    send = requests.adapters.HTTPAdapter.send
+
+    def recording_send(self, prepared, **kwargs):
+        response = send(self, prepared, **kwargs)
+        recorded.append({
+            "method": prepared.method,
+            "url": prepared.url,
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", "application/json"),
+            "body": response.text,
+        })
+        return response
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", recording_send)
+    yield
+    # Only keep fixtures of passing tests, so a rate-limited run is not replayed forever
+    report = getattr(request.node, "rep_call", None)
+    if recorded and report is not None and report.passed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(recorded))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose the call-phase report to fixtures as item.rep_call."""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call":
+        item.rep_call = report
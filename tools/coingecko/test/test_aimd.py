@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test module for the _aimd concurrency controller
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _aimd import AIMDController
+import asyncio
+import unittest
+
+
+async def _complete(controller, count, latency, throttled=False):
+    for _ in range(count):
+        await controller.acquire()
+        await controller.release(latency, throttled)
+
+
+class TestAIMDController(unittest.TestCase):
+
+    def test_fast_window_increases_additively(self):
+        """A window of fast, unthrottled requests adds alpha"""
+        controller = AIMDController(initial=4, window=4, alpha=0.5)
+        asyncio.run(_complete(controller, 4, latency=0.1))
+        self.assertEqual(controller.limit, 4.5)
+
+    def test_throttled_window_decreases_multiplicatively(self):
+        """Any throttled request in a window multiplies by beta"""
+        controller = AIMDController(initial=8, window=4, beta=0.5)
+        asyncio.run(_complete(controller, 4, latency=0.1, throttled=True))
+        self.assertEqual(controller.limit, 4.0)
+
+    def test_limit_stays_within_bounds(self):
+        """Limit never leaves [minimum, maximum]"""
+        controller = AIMDController(initial=2, minimum=1, maximum=3, window=1)
+        asyncio.run(_complete(controller, 10, latency=5.0))
+        self.assertEqual(controller.limit, 1)
+        asyncio.run(_complete(controller, 10, latency=0.01))
+        self.assertEqual(controller.limit, 3)
+
+    def test_acquire_blocks_at_limit(self):
+        """A worker waits while int(limit) requests are in flight"""
+        async def scenario():
+            controller = AIMDController(initial=1, window=100)
+            await controller.acquire()
+            waiter = asyncio.create_task(controller.acquire())
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+            await controller.release(0.1)
+            await asyncio.wait_for(waiter, timeout=1)
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test module for the _backoff retry decorator
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import _backoff
+from _backoff import backoff_retry
+import requests
+import unittest
+
+
+def _http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(response=response)
+
+
+class TestBackoffRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.sleeps = []
+        self._sleep = _backoff.time.sleep
+        _backoff.time.sleep = self.sleeps.append
+
+    def tearDown(self):
+        _backoff.time.sleep = self._sleep
+
+    def _flaky(self, errors):
+        """Return a wrapped function raising each error in turn, then succeeding."""
+        errors = list(errors)
+
+        @backoff_retry(max_tries=5, base=0.5, max_delay=30)
+        def call():
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+        return call
+
+    def test_retries_transient_errors(self):
+        """429/503 and timeouts are retried until success"""
+        call = self._flaky([_http_error(503), requests.exceptions.Timeout()])
+        self.assertEqual(call(), "ok")
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_honors_retry_after(self):
+        """Retry-After seconds override a shorter computed backoff"""
+        call = self._flaky([_http_error(429, {"Retry-After": "7"})])
+        call()
+        self.assertEqual(self.sleeps, [7.0])
+
+    def test_client_error_not_retried(self):
+        """Non-retryable 4xx responses raise immediately"""
+        call = self._flaky([_http_error(404)])
+        with self.assertRaises(requests.exceptions.HTTPError):
+            call()
+        self.assertEqual(self.sleeps, [])
+
+    def test_gives_up_after_max_tries(self):
+        """The last error is re-raised once attempts are exhausted"""
+        call = self._flaky([_http_error(502)] * 5)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            call()
+        self.assertEqual(len(self.sleeps), 4)
+        self.assertTrue(all(delay <= 30 for delay in self.sleeps))
+
+
+if __name__ == '__main__':
+    unittest.main()
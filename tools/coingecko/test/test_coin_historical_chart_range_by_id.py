@@ -8,11 +8,14 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from coin_historical_chart_range_by_id import get_coin_historical_chart_range_by_id
+import pytest
 import unittest
 import time
 
+@pytest.mark.network
 class TestCoinHistoricalChartRangeById(unittest.TestCase):
     
+    @pytest.mark.live
     def test_get_coin_market_chart_range_bitcoin_1_day(self):
         """Test getting Bitcoin market chart range for 1 day"""
         now = int(time.time())
@@ -24,6 +27,7 @@ class TestCoinHistoricalChartRangeById(unittest.TestCase):
         self.assertIn('total_volumes', result)
         self.assertGreater(len(result['prices']), 0)
         
+    @pytest.mark.live
     def test_get_coin_market_chart_range_ethereum_7_days(self):
         """Test getting Ethereum market chart range for 7 days"""
         now = int(time.time())
@@ -8,8 +8,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from coin_historical_data_by_id import get_coin_historical_data_by_id
+import pytest
 import unittest
 
+@pytest.mark.network
 class TestCoinHistoricalDataById(unittest.TestCase):
     
     def test_get_coin_historical_data_bitcoin(self):
@@ -8,8 +8,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from coin_ohlc_by_id import get_coin_ohlc_by_id
+import pytest
 import unittest
 
+@pytest.mark.network
 class TestCoinOhlcById(unittest.TestCase):
     
     def test_get_coin_ohlc_bitcoin_1_day(self):
@@ -8,8 +8,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from coingecko import get_coingecko_ohlc
+import pytest
 import unittest
 
+@pytest.mark.network
 class TestCoingecko(unittest.TestCase):
     
     def test_get_coingecko_ohlc_bitcoin_daily(self):
@@ -31,6 +33,7 @@ class TestCoingecko(unittest.TestCase):
         self.assertIsInstance(result, object)  # pandas DataFrame
         self.assertGreater(len(result), 0)
         
+    @pytest.mark.live
     def test_get_coingecko_ohlc_with_timestamps(self):
         """Test with timestamp inputs"""
         import time
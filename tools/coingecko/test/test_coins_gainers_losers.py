@@ -8,9 +8,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from coins_gainers_losers import get_top_gainers_losers
+import pytest
 import unittest
 import pandas as pd
 
+@pytest.mark.network
 class TestCoinsGainersLosers(unittest.TestCase):
     
     def test_get_top_gainers_losers_basic(self):
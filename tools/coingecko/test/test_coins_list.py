@@ -8,9 +8,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from coins_list import get_coins_list
+import pytest
 import unittest
 import pandas as pd
 
+@pytest.mark.network
 class TestCoinsList(unittest.TestCase):
     
     def test_get_coins_list_basic(self):
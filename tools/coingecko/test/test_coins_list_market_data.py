@@ -7,10 +7,13 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from coins_list_market_data import get_coins_list_market_data
+from coins_list_market_data import get_coins_list_market_data, get_coins_list_market_data_async, AIOHTTP_AVAILABLE
+import asyncio
+import pytest
 import unittest
 import pandas as pd
 
+@pytest.mark.network
 class TestCoinsListMarketData(unittest.TestCase):
     
     def test_get_coins_market_data_basic(self):
@@ -47,6 +50,14 @@ class TestCoinsListMarketData(unittest.TestCase):
         self.assertGreater(len(result), 0)
         # 检查 sparkline 字段
         self.assertIn('sparkline_in_7d', result.columns)
+    
+    @unittest.skipUnless(AIOHTTP_AVAILABLE, "aiohttp not installed")
+    def test_get_coins_market_data_async_pages(self):
+        """Test concurrent multi-page fetch"""
+        result = asyncio.run(get_coins_list_market_data_async(pages=range(1, 3), per_page=5))
+        self.assertIsInstance(result, pd.DataFrame)
+        self.assertLessEqual(len(result), 10)
+        self.assertTrue(result['id'].is_unique)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
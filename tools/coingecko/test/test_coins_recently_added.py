@@ -8,9 +8,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from coins_recently_added import get_recently_added_coins
+import pytest
 import unittest
 import pandas as pd
 
+@pytest.mark.network
 class TestCoinsRecentlyAdded(unittest.TestCase):
     
     def test_get_coins_recently_added(self):
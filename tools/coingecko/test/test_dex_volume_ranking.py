@@ -5,18 +5,31 @@ This test suite validates real external API connections and tool functionality.
 All tests use real DeFiLlama API calls to ensure the tool works correctly.
 """
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import functools
+import pytest
 import unittest
 import pandas as pd
-from tools.dex_volume_ranking import get_dex_volume_ranking
+from dex_volume_ranking import get_dex_volume_ranking
+
+
+@functools.lru_cache(maxsize=None)
+def _ranking(n):
+    """Fetch the top-n ranking once per session; the tests only read it."""
+    return get_dex_volume_ranking(n)
 
 
+@pytest.mark.network
 class TestDexVolumeRanking(unittest.TestCase):
     """Test suite for dex_volume_ranking with real external connections."""
     
     def test_real_api_connection(self):
         """Test actual API connection - no mocking allowed."""
         # Test with small number to avoid timeout
-        result = get_dex_volume_ranking(5)
+        result = _ranking(5)
         
         # Verify we got a DataFrame
         self.assertIsInstance(result, pd.DataFrame)
@@ -37,7 +50,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     
     def test_top_10_dexes(self):
         """Test getting top 10 DEXes with real API."""
-        result = get_dex_volume_ranking(10)
+        result = _ranking(10)
         
         # Verify we got up to 10 results
         self.assertGreater(len(result), 0)
@@ -53,7 +66,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     
     def test_single_dex(self):
         """Test getting single DEX (n=1)."""
-        result = get_dex_volume_ranking(1)
+        result = _ranking(1)
         
         self.assertEqual(len(result), 1)
         self.assertEqual(result.iloc[0]['rank'], 1)
@@ -63,7 +76,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     def test_large_number_request(self):
         """Test requesting large number of DEXes."""
         # Test with 20 DEXes
-        result = get_dex_volume_ranking(20)
+        result = _ranking(20)
         
         # Should return data (API typically has many DEXes)
         self.assertGreater(len(result), 0)
@@ -98,7 +111,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     
     def test_data_quality(self):
         """Test quality of returned data."""
-        result = get_dex_volume_ranking(5)
+        result = _ranking(5)
         
         # Verify all names are non-empty strings
         for name in result['name']:
@@ -117,7 +130,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     def test_zero_and_empty_values(self):
         """Test handling of zero and empty values from API."""
         # This test ensures our tool handles edge cases properly
-        result = get_dex_volume_ranking(10)
+        result = _ranking(10)
         
         # Verify no empty names
         for name in result['name']:
@@ -133,7 +146,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     def test_api_response_format(self):
         """Test that API response format matches expectations."""
         # Test with minimal request to check response structure
-        result = get_dex_volume_ranking(3)
+        result = _ranking(3)
         
         # Check that we have numeric data in expected ranges
         for _, row in result.iterrows():
@@ -160,7 +173,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     
     def test_ranking_consistency(self):
         """Test that ranking is consistent and logical."""
-        result = get_dex_volume_ranking(5)
+        result = _ranking(5)
         
         # Check that ranks are sequential starting from 1
         ranks = list(result['rank'])
@@ -174,7 +187,7 @@ class TestDexVolumeRanking(unittest.TestCase):
     
     def test_data_types_consistency(self):
         """Test that data types are consistent across results."""
-        result = get_dex_volume_ranking(5)
+        result = _ranking(5)
         
         # Check data types for each column
         for rank in result['rank']:
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test module for the _dtypes memory reduction helper
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _dtypes import reduce_memory
+import unittest
+import pandas as pd
+
+
+class TestReduceMemory(unittest.TestCase):
+
+    def test_downcasts_integers_and_listed_floats(self):
+        """Integers shrink; only the named float columns become float32"""
+        df = reduce_memory(pd.DataFrame({
+            'rank': [1, 2, 3],
+            'volume': [1.5e12, 2.0, 3.0],
+            'change': [0.5, -1.25, None],
+        }), float32_cols=['change'])
+        self.assertEqual(df['rank'].dtype, 'int8')
+        self.assertEqual(df['volume'].dtype, 'float64')
+        self.assertEqual(df['change'].dtype, 'float32')
+
+    def test_category_only_for_repeated_strings(self):
+        """Low-cardinality strings become category; unique ones do not"""
+        df = reduce_memory(pd.DataFrame({
+            'chain': ['eth'] * 5 + ['sol'],
+            'name': list('abcdef'),
+        }))
+        self.assertIsInstance(df['chain'].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(df['name'].dtype, pd.CategoricalDtype)
+
+    def test_skips_unhashable_columns(self):
+        """Nested values (e.g. roi dicts) are left untouched"""
+        df = reduce_memory(pd.DataFrame({'roi': [{'x': 1}, None, {'x': 1}]}))
+        self.assertEqual(df['roi'].dtype, object)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test module for the _http_cache helper
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import _http_cache
+from _http_cache import cached_get
+import json
+import tempfile
+import unittest
+
+
+class _Response:
+    def __init__(self, body):
+        self._body = body
+        self.content = json.dumps(body).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+class _CountingSession:
+    """Minimal session that returns a fresh body and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        return _Response({"call": self.calls, "params": params})
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._root = _http_cache.CACHE_ROOT
+        _http_cache.CACHE_ROOT = self._tmp.name
+
+    def tearDown(self):
+        _http_cache.CACHE_ROOT = self._root
+        self._tmp.cleanup()
+
+    def test_fresh_entry_served_from_cache(self):
+        """Second identical request within the TTL does not hit the session"""
+        session = _CountingSession()
+        first = cached_get(session, "https://example.com/a", params={"page": 1}, ttl=60)
+        second = cached_get(session, "https://example.com/a", params={"page": 1}, ttl=60)
+        self.assertEqual(first, second)
+        self.assertEqual(session.calls, 1)
+
+    def test_params_are_part_of_key(self):
+        """Different query parameters are cached separately"""
+        session = _CountingSession()
+        cached_get(session, "https://example.com/a", params={"page": 1}, ttl=60)
+        cached_get(session, "https://example.com/a", params={"page": 2}, ttl=60)
+        self.assertEqual(session.calls, 2)
+
+    def test_expired_entry_is_refetched(self):
+        """A zero TTL always goes back to the network"""
+        session = _CountingSession()
+        cached_get(session, "https://example.com/a", ttl=0)
+        result = cached_get(session, "https://example.com/a", ttl=0)
+        self.assertEqual(result["call"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test module for the _ratelimit sliding-window limiter
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import _ratelimit
+from _ratelimit import RateLimiter
+import unittest
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.sleeps = []
+        self._sleep = _ratelimit.time.sleep
+        _ratelimit.time.sleep = self.sleeps.append
+
+    def tearDown(self):
+        _ratelimit.time.sleep = self._sleep
+
+    def test_under_limit_does_not_wait(self):
+        """Requests within the RPM budget start immediately"""
+        limiter = RateLimiter(rpm=3)
+        for _ in range(3):
+            limiter.wait_if_throttled()
+        self.assertEqual(self.sleeps, [])
+
+    def test_full_window_waits(self):
+        """The request past the RPM budget sleeps until the oldest one expires"""
+        limiter = RateLimiter(rpm=2)
+        for _ in range(3):
+            limiter.wait_if_throttled()
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertLessEqual(self.sleeps[0], _ratelimit.WINDOW)
+
+    def test_observe_low_remaining_sleeps(self):
+        """A nearly exhausted server budget pauses for retry-after"""
+        limiter = RateLimiter(rpm=100)
+        limiter.observe({"x-ratelimit-remaining-requests": "5", "retry-after": "2"})
+        limiter.observe({"x-ratelimit-remaining-requests": "50"})
+        limiter.observe({})
+        self.assertEqual(self.sleeps, [2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
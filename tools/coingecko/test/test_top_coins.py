@@ -8,9 +8,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from top_coins import get_top_coins
+import pytest
 import unittest
 import pandas as pd
 
+@pytest.mark.network
 class TestTopCoins(unittest.TestCase):
     
     def test_get_top_coins_basic(self):
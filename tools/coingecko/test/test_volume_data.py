@@ -9,8 +9,10 @@ import pandas as pd
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from volume_data import get_volume_data
+import pytest
 import unittest
 
+@pytest.mark.network
 class TestVolumeData(unittest.TestCase):
     
     def test_get_volume_data_single_symbol(self):
@@ -6,6 +6,7 @@ from the CoinGlass API.
 
 Dependencies:
 - requests: For HTTP API calls
+- orjson: Faster JSON decoding (optional, falls back to requests)
 
 Environment Variables Required:
 - COINGLASS_API_KEY: Your CoinGlass API key (required for API access)
@@ -25,6 +26,11 @@ try:
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Load environment variables from project root directory
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -89,7 +95,7 @@ def get_funding_rate_oi_weight_ohlc_history(symbol="BTC", interval="1h", start_t
             response = requests.get(url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             # Check if API response is successful
             if (data.get("code") == 0 or data.get("code") == "0") and "data" in data:
@@ -102,7 +108,7 @@ def get_funding_rate_oi_weight_ohlc_history(symbol="BTC", interval="1h", start_t
             else:
                 raise ConnectionError(f"API error: {data.get('msg', 'Unknown error')}")
                 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: invalid JSON body
             if attempt == 2:  # Last attempt
                 raise ConnectionError(f"Failed to fetch data after 3 attempts: {str(e)}")
             time.sleep(1)  # Wait before retry
@@ -0,0 +1,39 @@
+"""
+Shared unittest base class for live CoinGlass endpoint tests
+
+Subclasses set ENDPOINT, ARGS and KEYS; the endpoint is fetched once in
+setUpClass and shared by every test method in the class.
+"""
+
+import unittest
+
+import pytest
+
+from _helpers import assert_tabular
+
+
+@pytest.mark.network
+class CoinGlassEndpointTestBase(unittest.TestCase):
+    ENDPOINT = None
+    ARGS = ()
+    KEYS = frozenset()
+
+    # The base class itself has no endpoint, so only collect subclasses
+    __test__ = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__test__ = True
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.result = cls.ENDPOINT(*cls.ARGS)
+        except ConnectionError as e:
+            if "Upgrade plan" in str(e):
+                raise unittest.SkipTest("API endpoint requires upgraded plan")
+            raise
+
+    def test_shape_and_keys(self):
+        """Endpoint data should be tabular and contain expected keys"""
+        assert_tabular(self.result, self.KEYS)
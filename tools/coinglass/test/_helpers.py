@@ -0,0 +1,49 @@
+"""
+Helpers shared by the CoinGlass tool tests
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Return module name, deferring its execution until first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def lazy_function(module_name, function_name):
+    """Return a stand-in for module_name.function_name that imports on first call."""
+    module = lazy_import(module_name)
+
+    def call(*args, **kwargs):
+        return getattr(module, function_name)(*args, **kwargs)
+
+    call.__name__ = function_name
+    call.load = lambda: getattr(module, function_name)  # run the module body now
+    return call
+
+
+def assert_tabular(result, keys):
+    """Assert result is a list, dict or DataFrame containing any expected key."""
+    keys = frozenset(keys)
+    # Only a loaded pandas can have produced a DataFrame, so avoid importing it here
+    pd = sys.modules.get("pandas")
+    tabular_types = (list, dict, pd.DataFrame) if pd else (list, dict)
+    assert isinstance(result, tabular_types), f"Unexpected result type: {type(result).__name__}"
+    if isinstance(result, list):
+        if result:
+            assert isinstance(result[0], dict), "First item should be a dictionary"
+            assert not keys.isdisjoint(result[0]), "First item should contain expected keys"
+    elif isinstance(result, dict):
+        if result:
+            assert not keys.isdisjoint(result), "Result should contain expected keys"
+    elif not result.empty:
+        assert not keys.isdisjoint(result.columns), "DataFrame should contain expected columns"
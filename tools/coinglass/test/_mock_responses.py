@@ -0,0 +1,53 @@
+"""
+Canned CoinGlass API responses for offline tests
+
+Keys are URL path fragments; values are the full JSON bodies the API returns.
+"""
+
+import re
+
+
+def url_pattern(path):
+    """Match any CoinGlass URL containing path, whatever the query string."""
+    return re.compile(f".*{re.escape(path)}.*")
+
+
+def _ok(data):
+    return {"code": "0", "msg": "success", "data": data}
+
+
+RESPONSES = {
+    "/api/index/fear-greed-history": _ok({
+        "data_list": [25.0, 32.0],
+        "price_list": [63000.5, 64210.0],
+        "time_list": [1719792000000, 1719878400000],
+    }),
+    "/api/futures/liquidation/coin-list": _ok([
+        {"symbol": "BTC", "totalLiquidation": 1250000.0, "longLiquidation": 800000.0, "shortLiquidation": 450000.0},
+        {"symbol": "ETH", "totalLiquidation": 640000.0, "longLiquidation": 300000.0, "shortLiquidation": 340000.0},
+    ]),
+    "/api/futures/open-interest/aggregated-history": _ok([
+        {"time": 1719792000000, "open": 3.51e10, "high": 3.56e10, "low": 3.49e10, "close": 3.54e10},
+        {"time": 1719795600000, "open": 3.54e10, "high": 3.58e10, "low": 3.52e10, "close": 3.57e10},
+    ]),
+    "/api/spot/supported-coins": _ok([
+        {"symbol": "BTC", "name": "Bitcoin"},
+        {"symbol": "ETH", "name": "Ethereum"},
+    ]),
+    "/api/spot/supported-exchange-pairs": _ok({
+        "Binance": [{"instrument_id": "BTCUSDT", "base_asset": "BTC", "quote_asset": "USDT"}],
+        "OKX": [{"instrument_id": "BTC-USDT", "base_asset": "BTC", "quote_asset": "USDT"}],
+    }),
+    "/api/futures/taker-buy-sell-volume/exchange-list": _ok({
+        "symbol": "BTC",
+        "buy_ratio": 51.2,
+        "sell_ratio": 48.8,
+        "exchange_list": [{"exchange": "Binance", "buy_ratio": 52.1, "sell_ratio": 47.9}],
+    }),
+    "/api/hyperliquid/whale-alert": _ok([
+        {"user": "0x3fa2", "symbol": "BTC", "size": 12.5, "side": "long", "price": 64100.0, "timestamp": 1719792000000},
+    ]),
+    "/api/hyperliquid/whale-position": _ok([
+        {"user": "0x3fa2", "symbol": "BTC", "size": 12.5, "unrealizedPnl": 18250.0, "marginRatio": 0.12},
+    ]),
+}
@@ -0,0 +1,122 @@
+"""
+Shared pytest fixtures for CoinGlass tool tests
+
+Each endpoint is fetched once per test session and the result is shared by
+all assertion tests that consume it. Responses are also snapshotted to
+fixtures/<endpoint>.json and reused for 24 hours; pass --refresh-fixtures
+to fetch them again.
+
+Tests not marked 'network' never touch the API: the requests transport is
+stubbed with the responses library, serving bodies from _mock_responses.py,
+so the real get_* code paths (status checks, retries, parsing) still run.
+"""
+
+import functools
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the tools directory importable once for every test module
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pytest
+import responses
+
+from _mock_responses import RESPONSES, url_pattern
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+SNAPSHOT_TTL = 24 * 60 * 60  # seconds
+
+
+def pytest_addoption(parser):
+    parser.addoption("--refresh-fixtures", action="store_true",
+                     help="Ignore cached endpoint snapshots and fetch fresh data")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: test calls the live CoinGlass API")
+
+
+def fetch(fn, *args):
+    """Call an endpoint, skipping when the API plan does not cover it."""
+    try:
+        return fn(*args)
+    except ConnectionError as e:
+        if "Upgrade plan" in str(e):
+            pytest.skip("API endpoint requires upgraded plan")
+        raise
+
+
+def api_key_configured():
+    """Check the environment and the project .env for COINGLASS_API_KEY."""
+    if os.getenv("COINGLASS_API_KEY"):
+        return True
+    # Endpoint modules are imported lazily, so their .env loading may not have run yet
+    env_path = Path(__file__).resolve().parents[3] / ".env"
+    return env_path.exists() and any(
+        line.strip().startswith("COINGLASS_API_KEY=") for line in env_path.read_text().splitlines()
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live tests up front when no API key is configured."""
+    if api_key_configured():
+        return
+    skip_network = pytest.mark.skip(reason="COINGLASS_API_KEY not set; live API tests skipped")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+def snapshot(name, producer, ttl=SNAPSHOT_TTL, refresh=False):
+    """Return producer() result, cached as JSON on disk for ttl seconds."""
+    path = FIXTURE_DIR / f"{name}.json"
+    if not refresh and path.exists() and time.time() - path.stat().st_mtime < ttl:
+        data = json.loads(path.read_text())
+        if isinstance(data, dict) and "__dataframe__" in data:
+            import pandas as pd
+            return pd.DataFrame(data["__dataframe__"])
+        return data
+
+    data = producer()
+    stored = {"__dataframe__": data.to_dict("records")} if hasattr(data, "to_dict") else data
+    FIXTURE_DIR.mkdir(exist_ok=True)
+    # Atomic replace: other xdist workers may be reading this snapshot right now
+    fd, tmp = tempfile.mkstemp(dir=FIXTURE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(stored, f, default=str)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return data
+
+
+@pytest.fixture(autouse=True)
+def mock_http(monkeypatch, request):
+    """Stub the CoinGlass API with canned responses for tests not marked network."""
+    if "network" in request.keywords:
+        yield None
+        return
+    monkeypatch.setenv("COINGLASS_API_KEY", "test-key")
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        for path, body in RESPONSES.items():
+            rsps.add(responses.GET, url_pattern(path), json=body, status=200)
+        yield rsps
+
+
+@pytest.fixture(scope="session")
+def call(request):
+    """Return an endpoint caller memoized on (function, args) for the session."""
+    refresh = request.config.getoption("--refresh-fixtures")
+
+    @functools.lru_cache(maxsize=None)
+    def cached(fn, args):
+        name = "-".join([fn.__name__.removeprefix("get_")] + [str(arg) for arg in args])
+        return snapshot(name, lambda: fn(*args), refresh=refresh)
+
+    return lambda fn, *args: fetch(cached, fn, args)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Table-driven tests for CoinGlass endpoint tools
+
+Each row of ENDPOINTS describes one endpoint: its callable, call arguments,
+expected keys and the shape of the returned data. The live tests fetch
+all table endpoints concurrently in one event loop before asserting.
+"""
+
+import asyncio
+
+from _helpers import assert_tabular, lazy_function
+from _mock_responses import url_pattern
+import pytest
+import responses
+
+# Endpoint modules (and pandas) load only when a selected test calls them
+get_index_fear_greed_history = lazy_function("coinglass.index_fear_greed_history", "get_index_fear_greed_history")
+get_liquidation_coin_list = lazy_function("coinglass.liquidation_coin_list", "get_liquidation_coin_list")
+get_open_interest_aggregated_ohlc_history = lazy_function("coinglass.open_interest_aggregated_ohlc_history", "get_open_interest_aggregated_ohlc_history")
+get_spot_supported_coins = lazy_function("coinglass.spot_supported_coins", "get_spot_supported_coins")
+get_spot_supported_exchange_pairs = lazy_function("coinglass.spot_supported_exchange_pairs", "get_spot_supported_exchange_pairs")
+get_taker_buy_sell_exchange_ratio = lazy_function("coinglass.taker_buy_sell_exchange_ratio", "get_taker_buy_sell_exchange_ratio")
+get_whale_hyperliquid_alert = lazy_function("coinglass.whale_hyperliquid_alert", "get_whale_hyperliquid_alert")
+get_whale_hyperliquid_position = lazy_function("coinglass.whale_hyperliquid_position", "get_whale_hyperliquid_position")
+get_coin_taker_buy_sell_volume_history = lazy_function("coinglass.coin_taker_buy_sell_volume_history", "get_coin_taker_buy_sell_volume_history")
+get_funding_rate_arbitrage = lazy_function("coinglass.funding_rate_arbitrage", "get_funding_rate_arbitrage")
+get_funding_rate_exchange_list = lazy_function("coinglass.funding_rate_exchange_list", "get_funding_rate_exchange_list")
+get_funding_rate_oi_weight_ohlc_history = lazy_function("coinglass.funding_rate_oi_weight_ohlc_history", "get_funding_rate_oi_weight_ohlc_history")
+get_funding_rate_vol_weight_ohlc_history = lazy_function("coinglass.funding_rate_vol_weight_ohlc_history", "get_funding_rate_vol_weight_ohlc_history")
+get_futures_pairs_markets = lazy_function("coinglass.futures_pairs_markets", "get_futures_pairs_markets")
+get_futures_supported_coins = lazy_function("coinglass.futures_supported_coins", "get_futures_supported_coins")
+get_futures_supported_exchange_pairs = lazy_function("coinglass.futures_supported_exchange_pairs", "get_futures_supported_exchange_pairs")
+get_liquidation_coin_history = lazy_function("coinglass.liquidation_coin_history", "get_liquidation_coin_history")
+get_liquidation_exchange_list = lazy_function("coinglass.liquidation_exchange_list", "get_liquidation_exchange_list")
+get_liquidation_order = lazy_function("coinglass.liquidation_order", "get_liquidation_order")
+get_liquidation_pair_map = lazy_function("coinglass.liquidation_pair_map", "get_liquidation_pair_map")
+get_open_interest_aggregated_coin_margin_ohlc_history = lazy_function("coinglass.open_interest_aggregated_coin_margin_ohlc_history", "get_open_interest_aggregated_coin_margin_ohlc_history")
+get_open_interest_aggregated_stablecoin_ohlc_history = lazy_function("coinglass.open_interest_aggregated_stablecoin_ohlc_history", "get_open_interest_aggregated_stablecoin_ohlc_history")
+get_open_interest_exchange_list = lazy_function("coinglass.open_interest_exchange_list", "get_open_interest_exchange_list")
+
+# (name, function, args, expected keys, shape)
+ENDPOINTS = [
+    ("index_fear_greed_history", get_index_fear_greed_history, ("1d",),
+     frozenset({'data_list', 'price_list', 'time_list', 'timestamp', 'value', 'classification', 'index'}), "list_or_df"),
+    ("liquidation_coin_list", get_liquidation_coin_list, (),
+     frozenset({'symbol', 'totalLiquidation', 'longLiquidation', 'shortLiquidation'}), "list_or_df"),
+    ("open_interest_aggregated_ohlc_history", get_open_interest_aggregated_ohlc_history, ("BTC", "1h"),
+     frozenset({'timestamp', 'open', 'high', 'low', 'close', 'openInterest'}), "list_or_df"),
+    ("spot_supported_coins", get_spot_supported_coins, (),
+     frozenset({'symbol', 'name', 'id'}), "list_or_df"),
+    ("spot_supported_exchange_pairs", get_spot_supported_exchange_pairs, (),
+     None, "dict_of_lists"),
+    ("taker_buy_sell_exchange_ratio", get_taker_buy_sell_exchange_ratio, ("BTC", "4h"),
+     frozenset({'symbol', 'buy_ratio', 'sell_ratio', 'exchange_list'}), "dict"),
+    ("whale_hyperliquid_alert", get_whale_hyperliquid_alert, (10,),
+     frozenset({'timestamp', 'user', 'symbol', 'size', 'side', 'price'}), "list_or_df"),
+    ("whale_hyperliquid_position", get_whale_hyperliquid_position, ("BTC", 10),
+     frozenset({'user', 'symbol', 'position', 'size', 'unrealizedPnl', 'marginRatio'}), "list_or_df"),
+]
+
+IDS = [row[0] for row in ENDPOINTS]
+
+TAKER_EXCHANGE_KEYS = frozenset({'exchange', 'buy_ratio', 'sell_ratio'})
+
+# Every CoinGlass getter must refuse to run without COINGLASS_API_KEY
+API_KEY_FUNCTIONS = [row[1] for row in ENDPOINTS] + [
+    get_coin_taker_buy_sell_volume_history,
+    get_funding_rate_arbitrage,
+    get_funding_rate_exchange_list,
+    get_funding_rate_oi_weight_ohlc_history,
+    get_funding_rate_vol_weight_ohlc_history,
+    get_futures_pairs_markets,
+    get_futures_supported_coins,
+    get_futures_supported_exchange_pairs,
+    get_liquidation_coin_history,
+    get_liquidation_exchange_list,
+    get_liquidation_order,
+    get_liquidation_pair_map,
+    get_open_interest_aggregated_coin_margin_ohlc_history,
+    get_open_interest_aggregated_stablecoin_ohlc_history,
+    get_open_interest_exchange_list,
+]
+
+
+@pytest.fixture(scope="module")
+def all_endpoints(call):
+    """Fetch every table endpoint concurrently; failures are kept per endpoint."""
+    async def fetch_all():
+        return await asyncio.gather(
+            *(asyncio.to_thread(call, fn, *args) for _, fn, args, _, _ in ENDPOINTS),
+            return_exceptions=True,
+        )
+
+    return dict(zip(IDS, asyncio.run(fetch_all())))
+
+
+def endpoint_data(all_endpoints, name):
+    """Return a prefetched result, re-raising its error (or skip) if it failed."""
+    result = all_endpoints[name]
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def check_shape_and_keys(result, keys, shape):
+    """Assert that result has the expected shape and contains expected keys."""
+    if shape == "dict_of_lists":
+        assert isinstance(result, dict)
+        if result:
+            assert any(isinstance(pairs, list) for pairs in result.values()), "Should contain exchange data with trading pairs"
+    else:
+        if shape == "dict":
+            assert isinstance(result, dict)
+        assert_tabular(result, keys)
+
+
+@pytest.mark.network
+@pytest.mark.parametrize("name,fn,args,keys,shape", ENDPOINTS, ids=IDS)
+def test_shape_and_keys(all_endpoints, name, fn, args, keys, shape):
+    """Endpoint data should have the expected shape and keys"""
+    check_shape_and_keys(endpoint_data(all_endpoints, name), keys, shape)
+
+
+@pytest.mark.parametrize("name,fn,args,keys,shape", ENDPOINTS, ids=IDS)
+def test_parses_canned_response(name, fn, args, keys, shape):
+    """Endpoint should turn a canned API response into the expected shape"""
+    result = fn(*args)
+    assert len(result) > 0
+    check_shape_and_keys(result, keys, shape)
+
+
+def test_http_error_raises_connection_error(mock_http, monkeypatch):
+    """A failing endpoint should be retried and then raise ConnectionError"""
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    mock_http.replace(responses.GET, url_pattern("/api/futures/liquidation/coin-list"), status=502)
+    with pytest.raises(ConnectionError, match="after 3 attempts"):
+        get_liquidation_coin_list()
+
+
+@pytest.mark.parametrize("fn", API_KEY_FUNCTIONS, ids=lambda fn: fn.__name__)
+def test_api_key_validation(monkeypatch, fn):
+    """Endpoint should require COINGLASS_API_KEY"""
+    # Module bodies copy .env into os.environ, so load the module before removing the key
+    fn.load()
+    monkeypatch.delenv("COINGLASS_API_KEY", raising=False)
+    with pytest.raises(EnvironmentError, match="COINGLASS_API_KEY"):
+        fn()
+
+
+@pytest.mark.network
+def test_taker_exchange_list_keys(all_endpoints):
+    """Taker buy/sell exchange entries should contain expected keys"""
+    result = endpoint_data(all_endpoints, "taker_buy_sell_exchange_ratio")
+    if not result.get('exchange_list'):
+        pytest.skip("No exchange list returned")
+    assert not TAKER_EXCHANGE_KEYS.isdisjoint(result['exchange_list'][0]), "Exchange data should contain expected keys"
@@ -1,55 +1,14 @@
-#!/usr/bin/env python3
 """
 Test module for CoinGlass futures_pairs_markets tool
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from _helpers import lazy_function
+from _base import CoinGlassEndpointTestBase
 
-from coinglass.futures_pairs_markets import get_futures_pairs_markets
-import unittest
+get_futures_pairs_markets = lazy_function("coinglass.futures_pairs_markets", "get_futures_pairs_markets")
 
-class TestFuturesPairsMarkets(unittest.TestCase):
-    
-    def test_get_futures_pairs_markets(self):
-        """Test getting futures pairs markets data"""
-        try:
-            result = get_futures_pairs_markets("BTC")
-            self.assertIsInstance(result, (list, object))  # list or pandas DataFrame
-            
-            # Check if result is not empty (assuming there are pairs markets)
-            if len(result) > 0:
-                # Check if it's a list of dictionaries or DataFrame with columns
-                if isinstance(result, list):
-                    # Check if first item is a dictionary with expected keys
-                    if result[0] and isinstance(result[0], dict):
-                        possible_keys = ['symbol', 'price', 'priceChangePercent', 'volume', 'openInterest']
-                        has_expected_keys = any(key in result[0] for key in possible_keys)
-                        self.assertTrue(has_expected_keys, "First item should contain expected keys")
-                else:
-                    # DataFrame case
-                    possible_columns = ['symbol', 'price', 'priceChangePercent', 'volume', 'openInterest']
-                    has_expected_columns = any(col in result.columns for col in possible_columns)
-                    self.assertTrue(has_expected_columns, "DataFrame should contain expected columns")
-        except ConnectionError as e:
-            if "Upgrade plan" in str(e):
-                self.skipTest("API endpoint requires upgraded plan")
-            else:
-                raise
-            
-    def test_get_futures_pairs_markets_api_key_validation(self):
-        """Test API key validation"""
-        # Temporarily remove API key
-        original_key = os.getenv("COINGLASS_API_KEY")
-        if original_key:
-            os.environ.pop("COINGLASS_API_KEY", None)
-            
-            with self.assertRaises(EnvironmentError):
-                get_futures_pairs_markets()
-                
-            # Restore API key
-            os.environ["COINGLASS_API_KEY"] = original_key
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+class TestFuturesPairsMarkets(CoinGlassEndpointTestBase):
+    ENDPOINT = staticmethod(get_futures_pairs_markets)
+    ARGS = ("BTC",)
+    KEYS = frozenset({'symbol', 'price', 'priceChangePercent', 'volume', 'openInterest'})
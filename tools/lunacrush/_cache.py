@@ -0,0 +1,235 @@
+"""
+LunarCrush Response Cache Module
+
+This module provides a small on-disk JSON cache for LunarCrush API responses,
+so repeated identical queries skip the network until their data is stale.
+
+Cache Layout:
+- Files live under ~/.cache/lunacrush/<md5 of endpoint and params>.json
+- Each file stores {"ts": <fetch time>, "ttl": <seconds>, "body": <response>}
+- Writes are atomic (temp file + os.replace); read errors count as misses
+- Concurrent async misses for the same (endpoint, params) share one request
+- MEMORY_CACHE is a bounded in-process LRU for short-TTL endpoints that are
+  polled often but not worth a disk write (memory_cached_request)
+
+Usage Example:
+    from _cache import cached_request, ttl_for_interval
+
+    body = cached_request(make_lunacrush_request, "/coins/btc", params,
+                          ttl=ttl_for_interval("1d"))
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lunacrush")
+
+# Cache lifetime per data interval: finer-grained data goes stale sooner
+INTERVAL_TTLS = {
+    "1h": 5 * 60,
+    "1d": 60 * 60,
+    "1w": 24 * 60 * 60,
+}
+
+def ttl_for_interval(interval):
+    """Return the cache TTL in seconds for a LunarCrush interval string."""
+    return INTERVAL_TTLS.get(interval, 5 * 60)
+
+class FileCache:
+    """JSON file cache keyed by (endpoint, params) with a per-entry TTL."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, endpoint, params):
+        key = hashlib.md5(f"{endpoint}|{sorted((params or {}).items())}".encode()).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, endpoint, params=None):
+        """
+        Return the cached body for (endpoint, params), or None if missing or expired.
+        """
+        try:
+            with open(self._path(endpoint, params), encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["ts"] < entry["ttl"]:
+                return entry["body"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def set(self, endpoint, params, body, ttl):
+        """
+        Store body for (endpoint, params) for ttl seconds.
+
+        Caching is best effort: filesystem errors are ignored so a read-only
+        or full disk never fails the API call itself.
+        """
+        path = self._path(endpoint, params)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"ts": time.time(), "ttl": ttl, "body": body}, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+class TTLCache:
+    """Thread-safe in-memory cache with per-entry TTL and LRU eviction at maxsize."""
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()  # key -> (expiry time, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+# Shared instances used by the LunarCrush tool modules
+RESPONSE_CACHE = FileCache()
+MEMORY_CACHE = TTLCache()
+
+def _request_key(endpoint, params):
+    return (endpoint, tuple(sorted((params or {}).items())))
+
+# In-flight sync fetches by (endpoint, params), for threads that miss MEMORY_CACHE together
+_SYNC_INFLIGHT = {}
+_SYNC_INFLIGHT_LOCK = threading.Lock()
+
+def memory_cached_request(request_fn, endpoint, params, ttl):
+    """
+    Return request_fn(endpoint, params), served from MEMORY_CACHE for ttl seconds.
+    
+    Callers pass already-normalized endpoints, so "Bitcoin" and "bitcoin "
+    share an entry. Only successful responses are stored. Threads that miss
+    while an identical request is in flight wait for it instead of sending
+    their own; a failure is raised to all of them and is not cached.
+    """
+    key = _request_key(endpoint, params)
+    body = MEMORY_CACHE.get(key)
+    if body is not None:
+        return body
+    
+    # Single-flight across threads: the first miss fetches, later ones wait on its future
+    with _SYNC_INFLIGHT_LOCK:
+        # Re-check: a fetch may have finished between the read above and taking the lock
+        body = MEMORY_CACHE.get(key)
+        if body is not None:
+            return body
+        future = _SYNC_INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _SYNC_INFLIGHT[key] = concurrent.futures.Future()
+    if not owner:
+        return future.result()
+    
+    try:
+        body = request_fn(endpoint, params)
+        MEMORY_CACHE.set(key, body, ttl)
+        future.set_result(body)
+        return body
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _SYNC_INFLIGHT_LOCK:
+            del _SYNC_INFLIGHT[key]
+
+async def memory_cached_request_async(request_fn, endpoint, params, ttl):
+    """Async counterpart of memory_cached_request, with single-flight misses."""
+    key = _request_key(endpoint, params)
+    body = MEMORY_CACHE.get(key)
+    if body is not None:
+        return body
+    
+    async def fetch():
+        body = await request_fn(endpoint, params)
+        MEMORY_CACHE.set(key, body, ttl)
+        return body
+    
+    return await _single_flight(("memory",) + key, fetch)
+
+def clear_cache():
+    """Drop all in-memory entries (the on-disk cache is left alone)."""
+    MEMORY_CACHE.clear()
+
+# In-flight async fetches by (cache, endpoint, params), so duplicate concurrent misses await one task
+_INFLIGHT = {}
+
+async def _single_flight(key, fetch):
+    """Await the in-flight task for key on this loop, starting fetch() if there is none."""
+    loop = asyncio.get_running_loop()
+    task = _INFLIGHT.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(fetch())
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda t: _INFLIGHT.pop(key) if _INFLIGHT.get(key) is t else None)
+    # Shield so one caller being cancelled does not cancel the fetch for the others
+    return await asyncio.shield(task)
+
+def cached_request(request_fn, endpoint, params, ttl, force_refresh=False):
+    """
+    Return request_fn(endpoint, params), served from RESPONSE_CACHE when fresh.
+
+    Only successful responses are stored; exceptions propagate uncached.
+    Pass force_refresh=True to skip the cache read and refetch.
+    """
+    if not force_refresh:
+        body = RESPONSE_CACHE.get(endpoint, params)
+        if body is not None:
+            return body
+    body = request_fn(endpoint, params)
+    RESPONSE_CACHE.set(endpoint, params, body, ttl)
+    return body
+
+async def cached_request_async(request_fn, endpoint, params, ttl, force_refresh=False):
+    """
+    Async counterpart of cached_request for coroutine request functions.
+    
+    Callers that miss the cache while an identical request is already in
+    flight on the same event loop await that request instead of sending
+    their own (single-flight).
+    """
+    if not force_refresh:
+        body = RESPONSE_CACHE.get(endpoint, params)
+        if body is not None:
+            return body
+    
+    async def fetch():
+        body = await request_fn(endpoint, params)
+        RESPONSE_CACHE.set(endpoint, params, body, ttl)
+        return body
+    
+    return await _single_flight(("file",) + _request_key(endpoint, params), fetch)
@@ -6,12 +6,15 @@ for a social category from the LunarCrush API.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management (optional)
-- os: For accessing environment variables
+- python-dotenv: .env loading, done once on the first API call (optional)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
 
+Caching:
+- Successful responses are kept in memory for 10 minutes per
+  (category, time_frame), since category snapshots change slowly
+
 Usage Example:
     from tools.lunacrush.category_details import get_category_details
     
@@ -19,15 +22,23 @@ Usage Example:
     defi_category = get_category_details("defi")
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    pass
+import functools
+import time
+
+from lunacrush import make_lunacrush_request, LunarCrushError
+
+CATEGORY_CACHE_TTL = 600  # seconds
+CATEGORY_CACHE_MAXSIZE = 256
+# (endpoint, time_frame) -> (expiry time, response); only successful responses are stored
+_CATEGORY_CACHE = {}
 
-from lunacrush import make_lunacrush_request
+@functools.lru_cache(maxsize=512)
+def _endpoint_for(category):
+    """Normalize a category name once and return its details endpoint."""
+    category_cleaned = category.strip().lower()
+    if not category_cleaned:
+        raise ValueError("category cannot be empty")
+    return f"/categories/{category_cleaned}/details"
 
 def get_category_details(category, time_frame="24h"):
     """
@@ -38,21 +49,31 @@ def get_category_details(category, time_frame="24h"):
         time_frame (str): Time frame for metrics (default: "24h")
         
     Returns:
-        dict: API response with category metrics
+        dict: API response with category metrics (cached for CATEGORY_CACHE_TTL seconds)
     """
     
-    if not category or not category.strip():
+    if not category:
         raise ValueError("category cannot be empty")
     
-    category_cleaned = category.strip().lower()
+    endpoint = _endpoint_for(category)
+    key = (endpoint, time_frame)
+    cached = _CATEGORY_CACHE.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    
     params = {"time_frame": time_frame}
     
     try:
-        endpoint = f"/categories/{category_cleaned}/details"
         response = make_lunacrush_request(endpoint, params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch category details for '{category}': {str(e)}")
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch category details for '{category}': {e}", e.status) from e
+    
+    # Evict the oldest entry once full; dicts keep insertion order
+    _CATEGORY_CACHE.pop(key, None)
+    if len(_CATEGORY_CACHE) >= CATEGORY_CACHE_MAXSIZE:
+        _CATEGORY_CACHE.pop(next(iter(_CATEGORY_CACHE)))
+    _CATEGORY_CACHE[key] = (time.monotonic() + CATEGORY_CACHE_TTL, response)
+    return response
 
 
 if __name__ == "__main__":
@@ -64,7 +85,7 @@ if __name__ == "__main__":
     import argparse
     import json
     import csv
-    import io
+    import sys
     
     parser = argparse.ArgumentParser(description="Fetch category details from LunarCrush API")
     parser.add_argument('--category', required=True, help='Category to analyze (e.g., defi, nft, gaming)')
@@ -84,23 +105,16 @@ if __name__ == "__main__":
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 category_data = data['data']
+                writer = csv.writer(sys.stdout, lineterminator='\n')
                 if isinstance(category_data, dict):
-                    # Convert single dict to list for CSV output
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=category_data.keys())
-                    writer.writeheader()
-                    writer.writerow(category_data)
-                    print(output.getvalue())
-                elif isinstance(category_data, list):
-                    # Handle list of dicts
-                    if category_data:
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=category_data[0].keys())
-                        writer.writeheader()
-                        writer.writerows(category_data)
-                        print(output.getvalue())
-                    else:
-                        print("No data available")
+                    # Single dict: one header row, one value row
+                    writer.writerow(category_data.keys())
+                    writer.writerow(category_data.values())
+                elif isinstance(category_data, list) and category_data:
+                    # List of dicts: fix the column order once; missing keys become empty cells
+                    cols = list(category_data[0].keys())
+                    writer.writerow(cols)
+                    writer.writerows(tuple(row.get(c) for c in cols) for row in category_data)
                 else:
                     print("No data available")
             else:
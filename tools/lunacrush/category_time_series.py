@@ -6,30 +6,49 @@ for a category over time from the LunarCrush API.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management (optional)
-- os: For accessing environment variables
+- python-dotenv: .env loading, done once on the first API call (optional)
+- aiohttp: For the *_async variants (optional)
+- orjson: Faster CLI JSON output (optional, falls back to json)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
 
+Caching:
+- Responses are cached on disk with a TTL matched to the interval
+  (1h: 5 min, 1d: 1 hour, 1w: 24 hours); pass force_refresh=True to refetch
+
 Usage Example:
     from tools.lunacrush.category_time_series import get_category_time_series
     
     # Get DeFi category historical data
     defi_history = get_category_time_series("defi", data_points=30)
+    
+    # Fetch several categories concurrently (requires aiohttp)
+    results = await asyncio.gather(*(get_category_time_series_async(c) for c in ["defi", "nft"]))
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    pass
+from lunacrush import make_lunacrush_request, make_lunacrush_request_async, LunarCrushError
+from _cache import cached_request, cached_request_async, ttl_for_interval
 
-from lunacrush import make_lunacrush_request
+_VALID_INTERVALS = frozenset(("1h", "1d", "1w"))
+
+def _category_time_series_request(category, interval, data_points):
+    """Validate arguments and return the (endpoint, params) to request."""
+    cleaned = (category or "").strip()
+    if not cleaned:
+        raise ValueError("category cannot be empty")
+    
+    if interval not in _VALID_INTERVALS:
+        raise ValueError(f"Invalid interval: {interval}")
+    
+    category_cleaned = cleaned.lower()
+    params = {
+        "interval": interval,
+        "data_points": data_points
+    }
+    return f"/categories/{category_cleaned}/time-series", params
 
-def get_category_time_series(category, interval="1d", data_points=30):
+def get_category_time_series(category, interval="1d", data_points=30, force_refresh=False):
     """
     Get historical metrics for a category over time.
     
@@ -37,30 +56,34 @@ def get_category_time_series(category, interval="1d", data_points=30):
         category (str): Category to analyze
         interval (str): Time interval ("1h", "1d", "1w")
         data_points (int): Number of data points to return
+        force_refresh (bool): Bypass the on-disk response cache (default: False)
         
     Returns:
         dict: API response with historical category metrics
     """
+    endpoint, params = _category_time_series_request(category, interval, data_points)
     
-    if not category or not category.strip():
-        raise ValueError("category cannot be empty")
-    
-    valid_intervals = ["1h", "1d", "1w"]
-    if interval not in valid_intervals:
-        raise ValueError(f"Invalid interval: {interval}")
+    try:
+        response = cached_request(make_lunacrush_request, endpoint, params,
+                                  ttl_for_interval(interval), force_refresh)
+        return response
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch category time series for '{category}': {e}", e.status) from e
+
+async def get_category_time_series_async(category, interval="1d", data_points=30, force_refresh=False):
+    """
+    Async version of get_category_time_series for concurrent fetches.
     
-    category_cleaned = category.strip().lower()
-    params = {
-        "interval": interval,
-        "data_points": data_points
-    }
+    Example:
+        results = await asyncio.gather(*(get_category_time_series_async(c) for c in ["defi", "nft"]))
+    """
+    endpoint, params = _category_time_series_request(category, interval, data_points)
     
     try:
-        endpoint = f"/categories/{category_cleaned}/time-series"
-        response = make_lunacrush_request(endpoint, params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch category time series for '{category}': {str(e)}")
+        return await cached_request_async(make_lunacrush_request_async, endpoint, params,
+                                          ttl_for_interval(interval), force_refresh)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch category time series for '{category}': {e}", e.status) from e
 
 
 if __name__ == "__main__":
@@ -70,9 +93,12 @@ if __name__ == "__main__":
     #   python category_time_series.py --category defi
     #   python category_time_series.py --category nft --interval 1h --data_points 24 --output_format csv
     import argparse
-    import json
-    import csv
-    import io
+    import sys
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
     
     parser = argparse.ArgumentParser(description="Fetch category time series from LunarCrush API")
     parser.add_argument('--category', required=True, help='Category to analyze (e.g., defi, nft, gaming)')
@@ -88,26 +114,30 @@ if __name__ == "__main__":
         
         # Output in the specified format
         if args.output_format == 'json':
-            print(json.dumps(data, ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                import json
+                json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
+            import csv
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 category_data = data['data']
                 if isinstance(category_data, dict):
                     # Convert single dict to list for CSV output
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=category_data.keys())
+                    writer = csv.DictWriter(sys.stdout, fieldnames=category_data.keys(), lineterminator='\n')
                     writer.writeheader()
                     writer.writerow(category_data)
-                    print(output.getvalue())
                 elif isinstance(category_data, list):
                     # Handle list of dicts
                     if category_data:
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=category_data[0].keys())
+                        fieldnames = list(dict.fromkeys(k for row in category_data for k in row))
+                        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, lineterminator='\n')
                         writer.writeheader()
                         writer.writerows(category_data)
-                        print(output.getvalue())
                     else:
                         print("No data available")
                 else:
@@ -6,12 +6,17 @@ for a specific cryptocurrency from the LunarCrush API.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management (optional)
-- os: For accessing environment variables
+- python-dotenv: .env loading, done once on the first API call (optional)
+- aiohttp: For the *_async variants (optional)
+- orjson: Faster CLI JSON output (optional, falls back to json)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
 
+Caching:
+- Responses are cached on disk with a TTL matched to the interval
+  (1h: 5 min, 1d: 1 hour, 1w: 24 hours); pass force_refresh=True to refetch
+
 Usage Example:
     from tools.lunacrush.coin_meta import get_coin_meta
     
@@ -20,21 +25,51 @@ Usage Example:
     
     # Get Ethereum metadata by symbol
     eth_data = get_coin_meta("ETH")
+    
+    # Fetch several coins concurrently (requires aiohttp)
+    btc, eth = await asyncio.gather(get_coin_meta_async("BTC"), get_coin_meta_async("ETH"))
+    
+    # Or in one call, keyed by cleaned identifier
+    coins = get_coins_meta_batch(["BTC", "ETH", "SOL"])
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    # Load environment variables from project root directory
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    # Handle case where python-dotenv is not available
-    pass
+import asyncio
+import functools
+import time
 
-from lunacrush import make_lunacrush_request
+from lunacrush import (make_lunacrush_request, make_lunacrush_request_async, LunarCrushError,
+                       LunarCrushPermanentError, AIOHTTP_AVAILABLE, close_async_session)
+from _cache import cached_request, cached_request_async, ttl_for_interval
 
-def get_coin_meta(coin_identifier, interval="1d", data_points=30):
+_VALID_INTERVALS = frozenset(("1h", "1d", "1w"))
+
+def _coin_meta_request(coin_identifier, interval, data_points):
+    """Validate arguments and return the (endpoint, params) to request."""
+    # Validate parameters
+    cleaned = (coin_identifier or "").strip()
+    if not cleaned:
+        raise ValueError("coin_identifier cannot be empty")
+    
+    if interval not in _VALID_INTERVALS:
+        raise ValueError(f"Invalid interval: {interval}. Must be one of: 1h, 1d, 1w")
+    
+    if data_points < 1:
+        raise ValueError("data_points must be at least 1")
+    
+    if data_points > 720:  # Reasonable upper limit
+        raise ValueError("data_points cannot exceed 720")
+    
+    # Clean and prepare coin identifier
+    coin_id = cleaned.lower()
+    
+    # Prepare API parameters
+    params = {
+        "interval": interval,
+        "data_points": data_points
+    }
+    return f"/coins/{coin_id}", params
+
+def get_coin_meta(coin_identifier, interval="1d", data_points=30, force_refresh=False):
     """
     Fetch detailed metadata and metrics for a specific cryptocurrency.
     
@@ -53,6 +88,7 @@ def get_coin_meta(coin_identifier, interval="1d", data_points=30):
                        - "1w": Weekly data
         data_points (int): Number of time-series data points to return
                           (default: 30, max: varies by subscription)
+        force_refresh (bool): Bypass the on-disk response cache (default: False)
         
     Returns:
         dict: API response containing:
@@ -128,36 +164,92 @@ def get_coin_meta(coin_identifier, interval="1d", data_points=30):
             print(f"24h Price Change: {coin.get('percent_change_24h')}%")
     """
     
-    # Validate parameters
-    if not coin_identifier or not coin_identifier.strip():
-        raise ValueError("coin_identifier cannot be empty")
+    endpoint, params = _coin_meta_request(coin_identifier, interval, data_points)
     
-    valid_intervals = ["1h", "1d", "1w"]
-    if interval not in valid_intervals:
-        raise ValueError(f"Invalid interval: {interval}. Must be one of: {valid_intervals}")
+    # Make API request
+    try:
+        response = cached_request(make_lunacrush_request, endpoint, params,
+                                  ttl_for_interval(interval), force_refresh)
+        return response
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch coin metadata for '{coin_identifier}': {e}", e.status) from e
+
+async def get_coin_meta_async(coin_identifier, interval="1d", data_points=30, force_refresh=False):
+    """
+    Async version of get_coin_meta for fetching many coins concurrently.
     
-    if data_points < 1:
-        raise ValueError("data_points must be at least 1")
+    Example:
+        btc, eth = await asyncio.gather(get_coin_meta_async("BTC"), get_coin_meta_async("ETH"))
+    """
+    endpoint, params = _coin_meta_request(coin_identifier, interval, data_points)
     
-    if data_points > 720:  # Reasonable upper limit
-        raise ValueError("data_points cannot exceed 720")
+    try:
+        return await cached_request_async(make_lunacrush_request_async, endpoint, params,
+                                          ttl_for_interval(interval), force_refresh)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch coin metadata for '{coin_identifier}': {e}", e.status) from e
+
+def _unique_coin_ids(coin_identifiers):
+    """Clean identifiers, dropping blanks and duplicates while keeping order."""
+    cleaned = ((c or "").strip().lower() for c in coin_identifiers)
+    return list(dict.fromkeys(c for c in cleaned if c))
+
+async def get_coins_meta_batch_async(coin_identifiers, interval="1d", data_points=30):
+    """
+    Fetch metadata for several coins concurrently over one connection pool.
     
-    # Clean and prepare coin identifier
-    coin_id = coin_identifier.strip().lower()
+    Args:
+        coin_identifiers (list): Coin identifiers (symbols, names, or IDs)
+        interval (str): Time interval ("1h", "1d", "1w")
+        data_points (int): Number of time-series data points per coin
+        
+    Returns:
+        dict: Maps each cleaned (stripped, lowercased) identifier to its API
+              response, or to {} if that coin's request failed
+    """
+    coin_ids = _unique_coin_ids(coin_identifiers)
+    responses = await asyncio.gather(
+        *(get_coin_meta_async(c, interval, data_points) for c in coin_ids),
+        return_exceptions=True
+    )
+    return {c: ({} if isinstance(r, Exception) else r) for c, r in zip(coin_ids, responses)}
+
+def get_coins_meta_batch(coin_identifiers, interval="1d", data_points=30):
+    """
+    Fetch metadata for several coins in one call.
     
-    # Prepare API parameters
-    params = {
-        "interval": interval,
-        "data_points": data_points
-    }
+    LunarCrush v3 has no multi-coin detail endpoint, so one request per coin
+    is still made; with aiohttp installed they run concurrently, otherwise
+    sequentially. Duplicate identifiers are fetched once.
     
-    # Make API request
-    try:
-        endpoint = f"/coins/{coin_id}"
-        response = make_lunacrush_request(endpoint, params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch coin metadata for '{coin_identifier}': {str(e)}")
+    Args:
+        coin_identifiers (list): Coin identifiers (symbols, names, or IDs)
+        interval (str): Time interval ("1h", "1d", "1w")
+        data_points (int): Number of time-series data points per coin
+        
+    Returns:
+        dict: Maps each cleaned identifier to its response ({} on failure)
+        
+    Note:
+        Uses asyncio.run when aiohttp is available, so call
+        get_coins_meta_batch_async instead from inside an event loop.
+    """
+    if AIOHTTP_AVAILABLE:
+        async def run_batch():
+            # The shared session is bound to this short-lived loop, so close it before the loop ends
+            try:
+                return await get_coins_meta_batch_async(coin_identifiers, interval, data_points)
+            finally:
+                await close_async_session()
+        return asyncio.run(run_batch())
+    
+    results = {}
+    for coin_id in _unique_coin_ids(coin_identifiers):
+        try:
+            results[coin_id] = get_coin_meta(coin_id, interval, data_points)
+        except Exception:
+            results[coin_id] = {}
+    return results
 
 def get_coin_basic_info(coin_identifier):
     """
@@ -171,14 +263,28 @@ def get_coin_basic_info(coin_identifier):
         
     Note:
         This is a lightweight version that fetches minimal data points
-        for quick access to basic coin information.
+        for quick access to basic coin information. Results are memoized
+        in-process per identifier for the current clock hour.
     """
+    cleaned = (coin_identifier or "").strip().lower()
     try:
-        response = get_coin_meta(coin_identifier, interval="1d", data_points=1)
-        return response
+        return _basic_info_for_hour(cleaned, int(time.time() // 3600))
     except Exception:
         return {}
 
+@functools.lru_cache(maxsize=4096)
+def _basic_info_for_hour(coin_id, hour):
+    """
+    Memoized get_coin_meta(coin_id, "1d", 1); hour only buckets the cache key.
+    
+    Unknown coins (4xx) are cached as {} for the hour; transient failures
+    raise, so lru_cache does not store them and the next call retries.
+    """
+    try:
+        return get_coin_meta(coin_id, interval="1d", data_points=1)
+    except LunarCrushPermanentError:
+        return {}
+
 def get_coin_social_metrics(coin_identifier, days=7):
     """
     Get focused social media metrics for a coin.
@@ -212,7 +318,8 @@ def validate_coin_exists(coin_identifier):
         
     Note:
         This function makes a minimal API call to check coin existence
-        without retrieving full metadata.
+        without retrieving full metadata. It shares get_coin_basic_info's
+        hourly memo, so repeat checks of the same coin skip the network.
     """
     try:
         response = get_coin_basic_info(coin_identifier)
@@ -228,9 +335,12 @@ if __name__ == "__main__":
     #   python coin_meta.py --coin_identifier bitcoin
     #   python coin_meta.py --coin_identifier BTC --interval 1h --data_points 24 --output_format csv
     import argparse
-    import json
-    import csv
-    import io
+    import sys
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
     
     parser = argparse.ArgumentParser(description="Fetch coin metadata from LunarCrush API")
     parser.add_argument('--coin_identifier', required=True, help='Coin identifier (symbol, name, or ID)')
@@ -246,26 +356,30 @@ if __name__ == "__main__":
         
         # Output in the specified format
         if args.output_format == 'json':
-            print(json.dumps(data, ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                import json
+                json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
+            import csv
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 coin_data = data['data']
                 if isinstance(coin_data, dict):
                     # Convert single dict to list for CSV output
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=coin_data.keys())
+                    writer = csv.DictWriter(sys.stdout, fieldnames=coin_data.keys(), lineterminator='\n')
                     writer.writeheader()
                     writer.writerow(coin_data)
-                    print(output.getvalue())
                 elif isinstance(coin_data, list):
                     # Handle list of dicts
                     if coin_data:
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=coin_data[0].keys())
+                        fieldnames = list(dict.fromkeys(k for row in coin_data for k in row))
+                        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, lineterminator='\n')
                         writer.writeheader()
                         writer.writerows(coin_data)
-                        print(output.getvalue())
                     else:
                         print("No data available")
                 else:
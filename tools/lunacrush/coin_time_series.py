@@ -6,12 +6,18 @@ for a specific cryptocurrency over time from the LunarCrush API.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management (optional)
-- os: For accessing environment variables
+- python-dotenv: .env loading, done once on the first API call (optional)
+- aiohttp: For the *_async variants (optional)
+- orjson: Faster CLI JSON output (optional, falls back to json)
+- ijson: Incremental parsing for iter_coin_time_series (optional)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
 
+Caching:
+- Responses are cached on disk with a TTL matched to the interval
+  (1h: 5 min, 1d: 1 hour, 1w: 24 hours); pass force_refresh=True to refetch
+
 Usage Example:
     from tools.lunacrush.coin_time_series import get_coin_time_series
     
@@ -20,21 +26,58 @@ Usage Example:
     
     # Get Ethereum hourly data for last 24 hours
     eth_timeseries = get_coin_time_series("ETH", interval="1h", data_points=24)
+    
+    # Fetch several coins concurrently (requires aiohttp)
+    btc, eth = await asyncio.gather(get_coin_time_series_async("BTC"), get_coin_time_series_async("ETH"))
+    
+    # Or many coins with bounded concurrency, keyed by identifier
+    series = await get_many_coin_time_series(["BTC", "ETH", "SOL"], concurrency=8)
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    # Load environment variables from project root directory
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    # Handle case where python-dotenv is not available
-    pass
+import asyncio
+
+from lunacrush import (make_lunacrush_request, make_lunacrush_request_async, stream_lunacrush_items,
+                       LunarCrushError, IJSON_AVAILABLE)
+from _cache import cached_request, cached_request_async, ttl_for_interval
+
+_VALID_INTERVALS = frozenset(("1h", "1d", "1w"))
 
-from lunacrush import make_lunacrush_request
+# Pre-joined metric filters for the convenience wrappers below
+_PRICE_METRICS = "price,volume,market_cap,high,low,open,close"
+_SOCIAL_METRICS = "social_volume,social_dominance,sentiment,tweets,news,reddit_posts,youtube,social_score"
+_GALAXY_METRICS = "galaxy_score,alt_rank,price_score,social_score,correlation_rank,volatility"
+
+def _coin_time_series_request(coin_identifier, interval, data_points, metrics):
+    """Validate arguments and return the (endpoint, params) to request."""
+    # Validate parameters
+    cleaned = (coin_identifier or "").strip()
+    if not cleaned:
+        raise ValueError("coin_identifier cannot be empty")
+    
+    if interval not in _VALID_INTERVALS:
+        raise ValueError(f"Invalid interval: {interval}. Must be one of: 1h, 1d, 1w")
+    
+    if data_points < 1:
+        raise ValueError("data_points must be at least 1")
+    
+    if data_points > 720:  # Reasonable upper limit
+        raise ValueError("data_points cannot exceed 720")
+    
+    # Clean and prepare coin identifier
+    coin_id = cleaned.lower()
+    
+    # Prepare API parameters
+    params = {
+        "interval": interval,
+        "data_points": data_points
+    }
+    
+    # Add metrics filter if specified
+    if metrics:
+        params["metrics"] = metrics if isinstance(metrics, str) else ",".join(metrics)
+    return f"/coins/{coin_id}/time-series", params
 
-def get_coin_time_series(coin_identifier, interval="1d", data_points=30, metrics=None):
+def get_coin_time_series(coin_identifier, interval="1d", data_points=30, metrics=None, force_refresh=False):
     """
     Fetch historical social and market metrics for a specific cryptocurrency.
     
@@ -53,9 +96,11 @@ def get_coin_time_series(coin_identifier, interval="1d", data_points=30, metrics
                        - "1w": Weekly data
         data_points (int): Number of time-series data points to return
                           (default: 30, max: varies by subscription)
-        metrics (list, optional): Specific metrics to include. If None, returns all available.
+        metrics (list or str, optional): Specific metrics to include, as a list or a
+            comma-separated string. If None, returns all available.
                                  Options: ["price", "volume", "market_cap", "social_volume", 
                                           "sentiment", "galaxy_score", "alt_rank", etc.]
+        force_refresh (bool): Bypass the on-disk response cache (default: False)
         
     Returns:
         dict: API response containing:
@@ -126,43 +171,93 @@ def get_coin_time_series(coin_identifier, interval="1d", data_points=30, metrics
                 print(f"Time: {timestamp}, Price: ${price}, Social Volume: {social_vol}")
     """
     
-    # Validate parameters
-    if not coin_identifier or not coin_identifier.strip():
-        raise ValueError("coin_identifier cannot be empty")
+    endpoint, params = _coin_time_series_request(coin_identifier, interval, data_points, metrics)
     
-    valid_intervals = ["1h", "1d", "1w"]
-    if interval not in valid_intervals:
-        raise ValueError(f"Invalid interval: {interval}. Must be one of: {valid_intervals}")
+    # Make API request
+    try:
+        response = cached_request(make_lunacrush_request, endpoint, params,
+                                  ttl_for_interval(interval), force_refresh)
+        return response
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch time series data for '{coin_identifier}': {e}", e.status) from e
+
+async def get_coin_time_series_async(coin_identifier, interval="1d", data_points=30, metrics=None, force_refresh=False):
+    """
+    Async version of get_coin_time_series for fetching many coins concurrently.
     
-    if data_points < 1:
-        raise ValueError("data_points must be at least 1")
+    Example:
+        btc, eth = await asyncio.gather(get_coin_time_series_async("BTC"), get_coin_time_series_async("ETH"))
+    """
+    endpoint, params = _coin_time_series_request(coin_identifier, interval, data_points, metrics)
     
-    if data_points > 720:  # Reasonable upper limit
-        raise ValueError("data_points cannot exceed 720")
+    try:
+        return await cached_request_async(make_lunacrush_request_async, endpoint, params,
+                                          ttl_for_interval(interval), force_refresh)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch time series data for '{coin_identifier}': {e}", e.status) from e
+
+def iter_coin_time_series(coin_identifier, interval="1d", data_points=30, metrics=None):
+    """
+    Iterate over a coin's time-series points without holding the full list.
     
-    # Clean and prepare coin identifier
-    coin_id = coin_identifier.strip().lower()
+    With ijson installed the response is parsed incrementally and points are
+    yielded as they arrive, bypassing the response cache. Without it this
+    falls back to get_coin_time_series (cached) and yields from its list.
+    Either way `data` may be the list of points or a dict with "timeSeries".
     
-    # Prepare API parameters
-    params = {
-        "interval": interval,
-        "data_points": data_points
-    }
+    Args:
+        coin_identifier (str): Coin identifier (symbol, name, or ID)
+        interval (str): Time interval ("1h", "1d", "1w")
+        data_points (int): Number of data points to return
+        metrics (list or str, optional): Specific metrics to include
+        
+    Returns:
+        iterator: Yields one time-series point (dict) at a time
+        
+    Raises:
+        ValueError: On invalid arguments, before any request is made
+        LunarCrushError: Same types as get_coin_time_series, raised while iterating
+    """
+    # Validate here rather than in the generator, so bad arguments fail at the call
+    endpoint, params = _coin_time_series_request(coin_identifier, interval, data_points, metrics)
+    if not IJSON_AVAILABLE:
+        data = get_coin_time_series(coin_identifier, interval, data_points, metrics).get("data")
+        if isinstance(data, dict):
+            data = data.get("timeSeries")
+        return iter(data or [])
+    return _stream_coin_time_series(coin_identifier, endpoint, params)
+
+def _stream_coin_time_series(coin_identifier, endpoint, params):
+    """Stream the points of a validated time-series request."""
+    try:
+        yield from stream_lunacrush_items(endpoint, ("data.item", "data.timeSeries.item"), params)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch time series data for '{coin_identifier}': {e}", e.status) from e
+
+async def get_many_coin_time_series(coin_identifiers, interval="1d", data_points=30, metrics=None, concurrency=16):
+    """
+    Fetch time series for several coins concurrently, at most `concurrency` at a time.
     
-    # Add metrics filter if specified
-    if metrics:
-        if isinstance(metrics, list):
-            params["metrics"] = ",".join(metrics)
-        else:
-            params["metrics"] = str(metrics)
+    Args:
+        coin_identifiers (list): Coin identifiers (symbols, names, or IDs)
+        interval (str): Time interval ("1h", "1d", "1w")
+        data_points (int): Number of data points per coin
+        metrics (list or str, optional): Specific metrics to include
+        concurrency (int): Maximum number of requests in flight (default: 16)
+        
+    Returns:
+        dict: Maps each identifier to its API response, or to {} if that
+              coin's request failed
+    """
+    semaphore = asyncio.Semaphore(concurrency)
     
-    # Make API request
-    try:
-        endpoint = f"/coins/{coin_id}/time-series"
-        response = make_lunacrush_request(endpoint, params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch time series data for '{coin_identifier}': {str(e)}")
+    async def fetch_one(coin_identifier):
+        async with semaphore:
+            return await get_coin_time_series_async(coin_identifier, interval, data_points, metrics)
+    
+    coin_ids = list(dict.fromkeys(coin_identifiers))
+    responses = await asyncio.gather(*(fetch_one(c) for c in coin_ids), return_exceptions=True)
+    return {c: ({} if isinstance(r, Exception) else r) for c, r in zip(coin_ids, responses)}
 
 def get_coin_price_history(coin_identifier, days=30):
     """
@@ -180,8 +275,7 @@ def get_coin_price_history(coin_identifier, days=30):
         for simpler price analysis and charting.
     """
     try:
-        metrics = ["price", "volume", "market_cap", "high", "low", "open", "close"]
-        response = get_coin_time_series(coin_identifier, "1d", days, metrics)
+        response = get_coin_time_series(coin_identifier, "1d", days, _PRICE_METRICS)
         return response
     except Exception:
         return {}
@@ -202,11 +296,7 @@ def get_coin_social_history(coin_identifier, days=7):
         only social-related metrics over the specified time period.
     """
     try:
-        social_metrics = [
-            "social_volume", "social_dominance", "sentiment", "tweets", 
-            "news", "reddit_posts", "youtube", "social_score"
-        ]
-        response = get_coin_time_series(coin_identifier, "1d", days, social_metrics)
+        response = get_coin_time_series(coin_identifier, "1d", days, _SOCIAL_METRICS)
         return response
     except Exception:
         return {}
@@ -227,11 +317,7 @@ def get_coin_galaxy_score_history(coin_identifier, days=30):
         and related performance metrics over time.
     """
     try:
-        galaxy_metrics = [
-            "galaxy_score", "alt_rank", "price_score", "social_score", 
-            "correlation_rank", "volatility"
-        ]
-        response = get_coin_time_series(coin_identifier, "1d", days, galaxy_metrics)
+        response = get_coin_time_series(coin_identifier, "1d", days, _GALAXY_METRICS)
         return response
     except Exception:
         return {}
@@ -244,9 +330,12 @@ if __name__ == "__main__":
     #   python coin_time_series.py --coin_identifier bitcoin
     #   python coin_time_series.py --coin_identifier BTC --interval 1h --data_points 24 --output_format csv
     import argparse
-    import json
-    import csv
-    import io
+    import sys
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
     
     parser = argparse.ArgumentParser(description="Fetch coin time series from LunarCrush API")
     parser.add_argument('--coin_identifier', required=True, help='Coin identifier (symbol, name, or ID)')
@@ -268,8 +357,15 @@ if __name__ == "__main__":
         
         # Output in the specified format
         if args.output_format == 'json':
-            print(json.dumps(data, ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                import json
+                json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
+            import csv
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 coin_data = data['data']
@@ -277,28 +373,25 @@ if __name__ == "__main__":
                     # Check if there's a timeSeries array
                     if 'timeSeries' in coin_data and isinstance(coin_data['timeSeries'], list):
                         if coin_data['timeSeries']:
-                            output = io.StringIO()
-                            writer = csv.DictWriter(output, fieldnames=coin_data['timeSeries'][0].keys())
+                            # Union of keys in first-seen order, so fields missing from the first row still get a column
+                            fieldnames = list(dict.fromkeys(k for row in coin_data['timeSeries'] for k in row))
+                            writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, lineterminator='\n')
                             writer.writeheader()
                             writer.writerows(coin_data['timeSeries'])
-                            print(output.getvalue())
                         else:
                             print("No time series data available")
                     else:
                         # Convert single dict to list for CSV output
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=coin_data.keys())
+                        writer = csv.DictWriter(sys.stdout, fieldnames=coin_data.keys(), lineterminator='\n')
                         writer.writeheader()
                         writer.writerow(coin_data)
-                        print(output.getvalue())
                 elif isinstance(coin_data, list):
                     # Handle list of dicts
                     if coin_data:
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=coin_data[0].keys())
+                        fieldnames = list(dict.fromkeys(k for row in coin_data for k in row))
+                        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, lineterminator='\n')
                         writer.writeheader()
                         writer.writerows(coin_data)
-                        print(output.getvalue())
                     else:
                         print("No data available")
                 else:
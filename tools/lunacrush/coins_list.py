@@ -6,12 +6,18 @@ from the LunarCrush API with their basic metrics and information.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management
-- os: For accessing environment variables
+- python-dotenv: .env loading, done once on the first API call (optional)
+- orjson: Faster CLI JSON output (optional, falls back to json)
+- aiohttp: For get_coins_list_async (optional)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
 
+Caching:
+- Responses are kept in memory for COINS_LIST_CACHE_TTL seconds (default: 60),
+  so get_coin_symbols and search_coins reuse one 1000-coin fetch; pass
+  force_refresh=True to refetch
+
 Usage Example:
     from tools.lunacrush.coins_list import get_coins_list
     
@@ -20,21 +26,69 @@ Usage Example:
     
     # Get top 100 coins sorted by galaxy score
     top_coins = get_coins_list(limit=100, sort="gs")
+    
+    # Look up a watchlist with one request, keyed by lowercased identifier
+    watchlist = get_coins_batch(["BTC", "ETH", "SOL"])
+    
+    # From async code, alongside other LunarCrush calls
+    coins, btc = await asyncio.gather(get_coins_list_async(limit=100), get_coin_meta_async("BTC"))
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    # Load environment variables from project root directory
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    # Handle case where python-dotenv is not available
-    pass
+import itertools
+import time
+
+from lunacrush import make_lunacrush_request, make_lunacrush_request_async, LunarCrushError
+from coin_meta import get_coin_basic_info
+
+_VALID_SORTS = frozenset({"gs", "alt_rank", "mc", "price", "price_score", "social_score", "sentiment"})
+
+COINS_LIST_CACHE_TTL = 60  # seconds; coin list metrics move on the order of minutes
+COINS_LIST_CACHE_MAXSIZE = 64
+# (limit, sort, desc) -> (expiry time, response); only successful responses are stored
+_COINS_LIST_CACHE = {}
+
+SYMBOLS_CACHE_TTL = 300  # seconds; the set of listed coins changes far more slowly than their metrics
+_SYMBOLS_CACHE = None  # (expiry time, tuple of symbols)
+# id(coins list) -> (coins list, [(casefolded name, casefolded symbol, coin), ...]);
+# holding the list keeps its id from being reused while the entry exists
+_SEARCH_INDEX_CACHE = {}
+_SEARCH_INDEX_MAXSIZE = 4
+
+def _coins_list_request(limit, sort, desc):
+    """Validate arguments and return the (cache key, params) to request."""
+    # Validate parameters
+    if limit > 1000:
+        raise ValueError("Limit cannot exceed 1000")
+    
+    if limit < 1:
+        raise ValueError("Limit must be at least 1")
+    
+    if sort not in _VALID_SORTS:
+        raise ValueError(f"Invalid sort field: {sort}. Must be one of: {sorted(_VALID_SORTS)}")
+    
+    params = {
+        "limit": limit,
+        "sort": sort,
+        "desc": "true" if desc else "false"
+    }
+    return (limit, sort, bool(desc)), params
+
+def _cached_coins_list(key, force_refresh):
+    """Return the cached response for key if still fresh, else None."""
+    cached = _COINS_LIST_CACHE.get(key)
+    if cached and cached[0] > time.monotonic() and not force_refresh:
+        return cached[1]
+    return None
 
-from lunacrush import make_lunacrush_request
+def _store_coins_list(key, response):
+    """Cache a successful response, evicting the oldest entry once full."""
+    # Dicts keep insertion order, so the first key is the oldest
+    _COINS_LIST_CACHE.pop(key, None)
+    if len(_COINS_LIST_CACHE) >= COINS_LIST_CACHE_MAXSIZE:
+        _COINS_LIST_CACHE.pop(next(iter(_COINS_LIST_CACHE)))
+    _COINS_LIST_CACHE[key] = (time.monotonic() + COINS_LIST_CACHE_TTL, response)
 
-def get_coins_list(limit=50, sort="gs", desc=True):
+def get_coins_list(limit=50, sort="gs", desc=True, force_refresh=False):
     """
     Fetch a list of coins with their basic metrics from LunarCrush.
     
@@ -53,6 +107,7 @@ def get_coins_list(limit=50, sort="gs", desc=True):
                    - "social_score": Social Score
                    - "sentiment": Average Sentiment
         desc (bool): Sort in descending order (default: True)
+        force_refresh (bool): Skip the in-memory cache and refetch (default: False)
         
     Returns:
         dict: API response containing:
@@ -89,30 +144,39 @@ def get_coins_list(limit=50, sort="gs", desc=True):
         best_performers = get_coins_list(limit=25, sort="alt_rank", desc=False)
     """
     
-    # Validate parameters
-    if limit > 1000:
-        raise ValueError("Limit cannot exceed 1000")
+    key, params = _coins_list_request(limit, sort, desc)
+    cached = _cached_coins_list(key, force_refresh)
+    if cached is not None:
+        return cached
     
-    if limit < 1:
-        raise ValueError("Limit must be at least 1")
+    # Make API request
+    try:
+        response = make_lunacrush_request("/coins", params)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch coins list: {e}", e.status) from e
     
-    valid_sorts = ["gs", "alt_rank", "mc", "price", "price_score", "social_score", "sentiment"]
-    if sort not in valid_sorts:
-        raise ValueError(f"Invalid sort field: {sort}. Must be one of: {valid_sorts}")
+    _store_coins_list(key, response)
+    return response
+
+async def get_coins_list_async(limit=50, sort="gs", desc=True, force_refresh=False):
+    """
+    Async version of get_coins_list; shares its validation and in-memory cache.
     
-    # Prepare API parameters
-    params = {
-        "limit": limit,
-        "sort": sort,
-        "desc": "true" if desc else "false"
-    }
+    Example:
+        coins, btc = await asyncio.gather(get_coins_list_async(limit=100), get_coin_meta_async("BTC"))
+    """
+    key, params = _coins_list_request(limit, sort, desc)
+    cached = _cached_coins_list(key, force_refresh)
+    if cached is not None:
+        return cached
     
-    # Make API request
     try:
-        response = make_lunacrush_request("/coins", params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch coins list: {str(e)}")
+        response = await make_lunacrush_request_async("/coins", params)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch coins list: {e}", e.status) from e
+    
+    _store_coins_list(key, response)
+    return response
 
 def get_coin_symbols():
     """
@@ -123,15 +187,47 @@ def get_coin_symbols():
         
     Note:
         This is a convenience function that extracts just the symbols
-        from the full coins list for quick reference.
+        from the full coins list for quick reference. The result is kept
+        in memory for SYMBOLS_CACHE_TTL seconds.
     """
+    global _SYMBOLS_CACHE
+    if _SYMBOLS_CACHE and _SYMBOLS_CACHE[0] > time.monotonic():
+        return list(_SYMBOLS_CACHE[1])
     try:
         response = get_coins_list(limit=1000)
-        if "data" in response:
-            return [coin.get("symbol", "") for coin in response["data"]]
-        return []
-    except Exception:
+    except ConnectionError:
         return []
+    symbols = [symbol for coin in response.get("data") or [] if (symbol := coin.get("symbol"))]
+    _SYMBOLS_CACHE = (time.monotonic() + SYMBOLS_CACHE_TTL, tuple(symbols))
+    return symbols
+
+def get_coins_batch(coin_identifiers):
+    """
+    Look up several coins by symbol or id with a single coins list request.
+    
+    Args:
+        coin_identifiers (list): Coin symbols or ids (e.g., ["BTC", "eth", "solana"])
+        
+    Returns:
+        dict: Maps each cleaned (stripped, lowercased) identifier to its coin
+              object from the coins list; identifiers not found are omitted
+        
+    Note:
+        LunarCrush has no multi-coin filter on /coins, so this reads the
+        top 1000 coins (cached for COINS_LIST_CACHE_TTL seconds) and picks
+        the requested ones out. Use get_coins_meta_batch from coin_meta for
+        coins outside the top 1000 or when full metadata is needed.
+    """
+    wanted = {c for c in ((i or "").strip().lower() for i in coin_identifiers) if c}
+    if not wanted:
+        return {}
+    
+    found = {}
+    for coin in get_coins_list(limit=1000).get("data") or []:
+        for key in ((coin.get("symbol") or "").lower(), str(coin.get("id", "")).lower()):
+            if key in wanted and key not in found:
+                found[key] = coin
+    return found
 
 def search_coins(query, limit=10):
     """
@@ -145,31 +241,41 @@ def search_coins(query, limit=10):
         list: List of matching coin objects
         
     Note:
-        This function performs a client-side search on the coins list.
-        For server-side search, use the specific coin endpoints.
+        A query that is an exact symbol or slug (e.g. "btc", "bitcoin") is
+        answered with a single coin lookup. Otherwise the top 200 coins are
+        searched client-side, widening to the top 1000 only if nothing matches.
     """
     try:
-        response = get_coins_list(limit=1000)
-        if "data" not in response:
+        query_folded = (query or "").strip().casefold()
+        if not query_folded:
             return []
         
-        query_lower = query.lower()
-        matches = []
+        if " " not in query_folded:
+            exact = get_coin_basic_info(query_folded).get("data")
+            if isinstance(exact, dict) and exact:
+                return [exact]
         
-        for coin in response["data"]:
-            name = coin.get("name", "").lower()
-            symbol = coin.get("symbol", "").lower()
-            
-            if query_lower in name or query_lower in symbol:
-                matches.append(coin)
-                
-            if len(matches) >= limit:
-                break
-                
-        return matches
-    except Exception:
+        for size in (200, 1000):
+            response = get_coins_list(limit=size)
+            index = _search_index(response.get("data") or [])
+            matches = list(itertools.islice(
+                (coin for name, symbol, coin in index if query_folded in name or query_folded in symbol), limit))
+            if matches:
+                return matches
+        return []
+    except ConnectionError:
         return []
 
+def _search_index(coins):
+    """Return (name, symbol, coin) tuples with casefolded text, built once per coins list."""
+    entry = _SEARCH_INDEX_CACHE.get(id(coins))
+    if entry is None or entry[0] is not coins:
+        if len(_SEARCH_INDEX_CACHE) >= _SEARCH_INDEX_MAXSIZE:
+            _SEARCH_INDEX_CACHE.clear()
+        index = [((coin.get("name") or "").casefold(), (coin.get("symbol") or "").casefold(), coin)
+                 for coin in coins]
+        entry = _SEARCH_INDEX_CACHE[id(coins)] = (coins, index)
+    return entry[1]
 
 if __name__ == "__main__":
     # This block allows the script to be run directly from the command line.
@@ -180,11 +286,16 @@ if __name__ == "__main__":
     import argparse
     import json
     import csv
-    import io
+    import sys
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
     
     parser = argparse.ArgumentParser(description="Fetch coins list from LunarCrush API")
     parser.add_argument('--limit', type=int, default=50, help='Maximum number of coins to return (default: 50)')
-    parser.add_argument('--sort', default='gs', choices=['gs', 'alt_rank', 'mc', 'price', 'price_score', 'social_score', 'sentiment'], 
+    parser.add_argument('--sort', default='gs', choices=sorted(_VALID_SORTS), 
                         help='Field to sort by (default: gs)')
     parser.add_argument('--desc', type=str, default='true', choices=['true', 'false'], 
                         help='Sort in descending order (default: true)')
@@ -201,17 +312,20 @@ if __name__ == "__main__":
         
         # Output in the specified format
         if args.output_format == 'json':
-            print(json.dumps(data, ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 coins_data = data['data']
                 if isinstance(coins_data, list) and coins_data:
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=coins_data[0].keys())
+                    writer = csv.DictWriter(sys.stdout, fieldnames=coins_data[0].keys(), lineterminator='\n')
                     writer.writeheader()
                     writer.writerows(coins_data)
-                    print(output.getvalue())
                 else:
                     print("No data available")
             else:
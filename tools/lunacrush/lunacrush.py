@@ -6,38 +6,181 @@ It includes common request handling, authentication, and error management.
 
 Dependencies:
 - requests: For HTTP API calls
-- python-dotenv: For environment variable management
+- python-dotenv: Loads the project .env on the first API call (optional)
 - os: For accessing environment variables
+- aiohttp: For concurrent async requests (optional)
+- ijson: For streaming large responses item by item (optional)
+- orjson: Faster JSON decoding (optional, falls back to requests)
+- brotli: Smaller responses (optional; requests and aiohttp advertise br in
+  Accept-Encoding only when it is installed, so never set that header by hand)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
+- LUNA_CRUSH_RPS: Requests per second allowed by your plan (optional, default: 10)
 
 API Rate Limits:
 - LunarCrush API has rate limits that vary by subscription tier
-- This module implements retry logic with delays to handle rate limiting
+- Requests are paced client-side to LUNA_CRUSH_RPS per second (default: 10),
+  shared by sync and async callers in the process
+- 408/429/5xx responses and network errors are retried after Retry-After
+  (or a jittered exponential delay), capped at MAX_RETRY_DELAY seconds;
+  other 4xx responses fail immediately
+
+Errors:
+- LunarCrushTransientError: throttling, 5xx, network failure or a non-JSON
+  body that outlived the retries; worth retrying later
+- LunarCrushPermanentError: other 4xx (e.g. 402 without credits, 404 unknown
+  coin); retrying will not help
+- Both subclass ConnectionError, so existing handlers keep working
 
 Usage Example:
     from tools.lunacrush.lunacrush import make_lunacrush_request
     
     # Make a request to the coins endpoint
     data = make_lunacrush_request("/coins")
+    
+    # Or from async code, sharing one connection pool
+    data = await make_lunacrush_request_async("/coins")
 """
 
+import asyncio
+import atexit
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
 import os
+import random
+import sys
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 try:
-    from dotenv import load_dotenv
-    # Load environment variables from project root directory
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    # Handle case where python-dotenv is not available
-    pass
+    ORJSON_AVAILABLE = False
 
 BASE_URL = "https://lunarcrush.com/api3"
+RETRY_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+class LunarCrushError(ConnectionError):
+    """A failed LunarCrush API request; status is the HTTP status, or None for network errors."""
+    
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+class LunarCrushTransientError(LunarCrushError):
+    """Throttling, server or network failure that persisted through the retries."""
+
+class LunarCrushPermanentError(LunarCrushError):
+    """A 4xx response that retrying will not fix."""
+
+_PAYMENT_REQUIRED_MSG = "LunarCrush API requires a paid subscription with credits. "
+
+class _RateLimiter:
+    """Space request starts at least 1/rate seconds apart across threads and tasks."""
+    
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self):
+        """Claim the next free slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+    
+    def wait(self):
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def wait_async(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+_LIMITER = _RateLimiter(float(os.getenv("LUNA_CRUSH_RPS", "10")))
+
+@functools.lru_cache(maxsize=1)
+def _ensure_env_loaded():
+    """Load the project .env once, on the first API call instead of at import."""
+    try:
+        from dotenv import load_dotenv
+        # Load environment variables from project root directory
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+        load_dotenv(os.path.join(project_root, '.env'))
+    except ImportError:
+        # Handle case where python-dotenv is not available
+        pass
+    # LUNA_CRUSH_RPS may come from .env, so re-read it now that .env is loaded
+    _LIMITER.interval = 1.0 / float(os.getenv("LUNA_CRUSH_RPS", "10"))
+
+@functools.lru_cache(maxsize=1)
+def _headers_for(api_key):
+    return {"Authorization": f"Bearer {api_key}"}
+
+def _auth_headers():
+    """Return the request headers, rebuilt only when LUNA_CRUSH_API_KEY changes."""
+    _ensure_env_loaded()
+    api_key = os.getenv("LUNA_CRUSH_API_KEY")
+    if not api_key:
+        raise EnvironmentError("Missing LUNA_CRUSH_API_KEY - set it in your .env file")
+    return _headers_for(api_key)
+
+@functools.lru_cache(maxsize=2048)
+def normalize_topic(topic):
+    """Return the canonical API form of a topic ("Bitcoin " -> "bitcoin"), memoized."""
+    return topic.strip().lower()
+
+@functools.lru_cache(maxsize=4096)
+def topic_endpoint(topic_cleaned, suffix):
+    """Return the interned "/topics/<topic>/<suffix>" path, so hot cache keys share one string."""
+    return sys.intern(f"/topics/{topic_cleaned}/{suffix}")
+
+MAX_RETRY_DELAY = 30.0  # seconds
+ETAG_CACHE_TTL = 24 * 60 * 60  # seconds a stored validator and body stay usable
 
-def make_lunacrush_request(endpoint, params=None, retries=3):
+def _retry_delay(attempt, retry_after):
+    """
+    Seconds to wait before retrying: Retry-After if given, else a random delay
+    in [0, min(MAX_RETRY_DELAY, 2**attempt)] so concurrent callers spread out.
+    Either way the wait is capped at MAX_RETRY_DELAY, so a long Retry-After
+    cannot block a tool call for minutes.
+    """
+    try:
+        return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+    except (TypeError, ValueError):
+        return random.uniform(0, min(MAX_RETRY_DELAY, 2 ** attempt))
+
+# Pooled sync session shared by every tool module. No urllib3 Retry on the
+# adapter: make_lunacrush_request does its own retrying.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+atexit.register(_SESSION.close)
+
+# (connect, read) seconds: an unreachable host fails fast and is retried,
+# while slow time-series responses still get the full read window
+REQUEST_TIMEOUT = (3.05, 15)
+
+# Lazily created aiohttp session, tied to the event loop that created it
+_ASYNC_SESSION = None
+_ASYNC_SESSION_LOOP = None
+
+def make_lunacrush_request(endpoint, params=None, retries=3, session=None, etag_cache=None):
     """
     Make a request to the LunarCrush API with automatic retry logic.
     
@@ -45,54 +188,241 @@ def make_lunacrush_request(endpoint, params=None, retries=3):
         endpoint (str): API endpoint path (e.g., "/coins", "/coins/bitcoin")
         params (dict, optional): Query parameters for the request
         retries (int): Number of retry attempts (default: 3)
+        session (requests.Session, optional): Session to send the request on
+            (default: the shared module session)
+        etag_cache (_cache.TTLCache, optional): Validators and bodies of
+            earlier responses, kept for ETAG_CACHE_TTL seconds. When given,
+            the request is conditional and a 304 returns the stored body
+            without transferring or decoding it again
         
     Returns:
         dict: JSON response from the API
         
     Raises:
         EnvironmentError: If LUNA_CRUSH_API_KEY is not set
-        ConnectionError: If all retry attempts fail
+        LunarCrushPermanentError: On a non-retryable 4xx response
+        LunarCrushTransientError: If all retry attempts fail (including
+            responses whose body is not valid JSON)
+        ValueError: If retries is less than 1
         
     Note:
         This function implements retry logic with delays between attempts
         to handle temporary API issues and rate limiting.
     """
-    api_key = os.getenv("LUNA_CRUSH_API_KEY")
-    if not api_key:
-        raise EnvironmentError("Missing LUNA_CRUSH_API_KEY - set it in your .env file")
+    if retries < 1:
+        raise ValueError("retries must be at least 1")
+    headers = _auth_headers()
     
     if params is None:
         params = {}
     
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
-    
     url = f"{BASE_URL}{endpoint}"
+    session = session or _SESSION
+    
+    cache_key = cached = None
+    if etag_cache is not None:
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        cached = etag_cache.get(cache_key)  # (etag, last_modified, body)
+        if cached is not None:
+            headers = dict(headers)
+            if cached[0]:
+                headers["If-None-Match"] = cached[0]
+            if cached[1]:
+                headers["If-Modified-Since"] = cached[1]
     
+    error = None
     for attempt in range(retries):
+        _LIMITER.wait()
+        retry_after = None
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=15)
-            
-            # Handle specific LunarCrush API errors
-            if response.status_code == 402:
-                error_msg = "LunarCrush API requires a paid subscription with credits. "
+            response = session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            error = LunarCrushTransientError(str(e))
+        else:
+            # Throttled or transient server error: honor Retry-After before retrying
+            if response.status_code in RETRY_STATUS:
+                retry_after = response.headers.get("Retry-After")
+                error = LunarCrushTransientError(f"HTTP {response.status_code} from {url}", response.status_code)
+            elif response.status_code == 304 and cached is not None:
+                return cached[2]
+            elif response.status_code == 402:
+                error_msg = _PAYMENT_REQUIRED_MSG
                 try:
-                    error_data = response.json()
-                    if "error" in error_data:
-                        error_msg += error_data["error"]
-                except:
+                    error_msg += response.json()["error"]
+                except (ValueError, KeyError, TypeError):
                     error_msg += "Please check your subscription at lunarcrush.com/pricing"
-                raise ConnectionError(error_msg)
-            
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            if attempt < retries - 1:
-                time.sleep(1 * (attempt + 1))  # Exponential backoff
-                continue
+                raise LunarCrushPermanentError(error_msg, 402)
             else:
-                raise ConnectionError(f"API request failed after {retries} attempts: {str(e)}")
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError as e:
+                    raise LunarCrushPermanentError(str(e), response.status_code) from e
+                try:
+                    body = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+                except ValueError as e:
+                    # e.g. an HTML error page from a proxy, served with 200
+                    error = LunarCrushTransientError(f"Invalid JSON from {url}: {e}", response.status_code)
+                else:
+                    if cache_key is not None:
+                        etag = response.headers.get("ETag")
+                        last_modified = response.headers.get("Last-Modified")
+                        if etag or last_modified:
+                            etag_cache.set(cache_key, (etag, last_modified, body), ETAG_CACHE_TTL)
+                    return body
+        if attempt < retries - 1:
+            time.sleep(_retry_delay(attempt, retry_after))
+    raise LunarCrushTransientError(f"API request failed after {retries} attempts: {error}", error.status)
+
+def stream_lunacrush_items(endpoint, prefix, params=None):
+    """
+    Yield the items under `prefix` of a LunarCrush response as they are parsed.
+    
+    For large responses (e.g. 720-point time series) this avoids decoding the
+    whole body at once. There is no retry: a failed status raises before the
+    first item, and a dropped connection raises mid-iteration.
+    
+    Args:
+        endpoint (str): API endpoint path (e.g., "/coins/bitcoin/time-series")
+        prefix (str or tuple): ijson path of the items to yield (e.g.,
+            "data.timeSeries.item"), or several paths when the response
+            shape varies; items under any of them are yielded in order
+        params (dict, optional): Query parameters for the request
+        
+    Yields:
+        dict: One decoded item at a time
+        
+    Raises:
+        ImportError: If ijson is not installed
+        EnvironmentError: If LUNA_CRUSH_API_KEY is not set
+        LunarCrushPermanentError: On a non-retryable 4xx response
+        LunarCrushTransientError: On a 429/5xx response or network error
+    """
+    if not IJSON_AVAILABLE:
+        raise ImportError("ijson is required for streaming LunarCrush responses - pip install ijson")
+    headers = _auth_headers()
+    
+    url = f"{BASE_URL}{endpoint}"
+    
+    _LIMITER.wait()
+    try:
+        response = _SESSION.get(url, params=params or {}, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)
+    except requests.RequestException as e:
+        raise LunarCrushTransientError(str(e)) from e
+    with response:
+        if response.status_code in RETRY_STATUS:
+            raise LunarCrushTransientError(f"HTTP {response.status_code} from {url}", response.status_code)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            raise LunarCrushPermanentError(str(e), response.status_code) from e
+        response.raw.decode_content = True  # let urllib3 undo gzip/deflate
+        if isinstance(prefix, str):
+            yield from ijson.items(response.raw, prefix, use_float=True)
+        else:
+            yield from _items_at(ijson.parse(response.raw, use_float=True), prefix)
+
+def _items_at(events, prefixes):
+    """Build and yield the values found at any of prefixes, like ijson.items does for one."""
+    events = iter(events)
+    for prefix, event, value in events:
+        if prefix not in prefixes or event in ("map_key", "end_map", "end_array"):
+            continue
+        if event not in ("start_map", "start_array"):
+            yield value
+            continue
+        # Nested containers have longer prefixes, so the first matching end closes this item
+        end = "end_map" if event == "start_map" else "end_array"
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        for inner_prefix, inner_event, inner_value in events:
+            builder.event(inner_event, inner_value)
+            if inner_prefix == prefix and inner_event == end:
+                break
+        yield builder.value
+
+def _get_async_session():
+    """Return the shared aiohttp session, creating it for the running loop if needed."""
+    global _ASYNC_SESSION, _ASYNC_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _ASYNC_SESSION is None or _ASYNC_SESSION.closed or _ASYNC_SESSION_LOOP is not loop:
+        _ASYNC_SESSION_LOOP = loop
+        _ASYNC_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75),
+            timeout=aiohttp.ClientTimeout(total=15, sock_connect=REQUEST_TIMEOUT[0]),
+        )
+    return _ASYNC_SESSION
+
+async def close_async_session():
+    """Close the shared aiohttp session; call before the event loop shuts down."""
+    global _ASYNC_SESSION
+    if _ASYNC_SESSION is not None and not _ASYNC_SESSION.closed:
+        await _ASYNC_SESSION.close()
+    _ASYNC_SESSION = None
+
+async def make_lunacrush_request_async(endpoint, params=None, retries=3):
+    """
+    Async counterpart of make_lunacrush_request using a shared aiohttp session.
+    
+    Lets callers fan out many requests with asyncio.gather over one
+    connection pool. Retry, 402 handling and errors match the sync version.
+    
+    Args:
+        endpoint (str): API endpoint path (e.g., "/coins", "/coins/bitcoin")
+        params (dict, optional): Query parameters for the request
+        retries (int): Number of retry attempts (default: 3)
+        
+    Returns:
+        dict: JSON response from the API
+        
+    Raises:
+        ImportError: If aiohttp is not installed
+        EnvironmentError: If LUNA_CRUSH_API_KEY is not set
+        LunarCrushPermanentError: On a non-retryable 4xx response
+        LunarCrushTransientError: If all retry attempts fail
+        ValueError: If retries is less than 1
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("aiohttp is required for async LunarCrush requests - pip install aiohttp")
+    if retries < 1:
+        raise ValueError("retries must be at least 1")
+    headers = _auth_headers()
+    
+    url = f"{BASE_URL}{endpoint}"
+    session = _get_async_session()
+    
+    error = None
+    for attempt in range(retries):
+        await _LIMITER.wait_async()
+        retry_after = None
+        try:
+            async with session.get(url, params=params or {}, headers=headers) as response:
+                # Throttled or transient server error: honor Retry-After before retrying
+                if response.status in RETRY_STATUS:
+                    retry_after = response.headers.get("Retry-After")
+                    error = LunarCrushTransientError(f"HTTP {response.status} from {url}", response.status)
+                elif response.status == 402:
+                    error_msg = _PAYMENT_REQUIRED_MSG
+                    try:
+                        error_msg += (await response.json(content_type=None))["error"]
+                    except (ValueError, KeyError, TypeError):
+                        error_msg += "Please check your subscription at lunarcrush.com/pricing"
+                    raise LunarCrushPermanentError(error_msg, 402)
+                else:
+                    try:
+                        response.raise_for_status()
+                    except aiohttp.ClientResponseError as e:
+                        raise LunarCrushPermanentError(str(e), response.status) from e
+                    try:
+                        if ORJSON_AVAILABLE:
+                            return orjson.loads(await response.read())
+                        return await response.json(content_type=None)
+                    except ValueError as e:
+                        error = LunarCrushTransientError(f"Invalid JSON from {url}: {e}", response.status)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error = LunarCrushTransientError(str(e) or type(e).__name__)
+        if attempt < retries - 1:
+            await asyncio.sleep(_retry_delay(attempt, retry_after))
+    raise LunarCrushTransientError(f"API request failed after {retries} attempts: {error}", error.status)
 
 def validate_api_key():
     """
@@ -105,6 +435,7 @@ def validate_api_key():
         This function only checks if the environment variable is set,
         not if the key is valid. Use test_api_connection() for validation.
     """
+    _ensure_env_loaded()
     return bool(os.getenv("LUNA_CRUSH_API_KEY"))
 
 def test_api_connection():
@@ -0,0 +1,33 @@
+"""
+Shared pytest configuration for LunarCrush tool tests
+
+The live API tests are independent of each other, so they can run in
+parallel with pytest-xdist:
+
+    pytest tools/lunacrush/test -n 4
+
+Each xdist worker is a separate process with its own request pacer, so the
+LUNA_CRUSH_RPS budget (from the environment or the project .env) is split
+evenly across workers before any tool module is imported; together they
+stay within the plan's rate limit.
+"""
+
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+
+
+def _dotenv_value(name):
+    """Read name from the project .env without loading it into os.environ."""
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return None
+    return dotenv_values(os.path.join(PROJECT_ROOT, ".env")).get(name)
+
+
+def pytest_configure(config):
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if workers > 1:
+        rps = float(os.environ.get("LUNA_CRUSH_RPS") or _dotenv_value("LUNA_CRUSH_RPS") or "10")
+        os.environ["LUNA_CRUSH_RPS"] = str(rps / workers)
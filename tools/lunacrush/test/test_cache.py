@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test module for the LunarCrush _cache helpers
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import _cache
+from _cache import FileCache, TTLCache, cached_request, cached_request_async, memory_cached_request
+from _cache import memory_cached_request_async
+import asyncio
+import concurrent.futures
+import tempfile
+import threading
+import time
+import unittest
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cache = _cache.RESPONSE_CACHE
+        _cache.RESPONSE_CACHE = FileCache(self._tmp.name)
+        self.calls = []
+
+    def tearDown(self):
+        _cache.RESPONSE_CACHE = self._cache
+        self._tmp.cleanup()
+
+    def _request(self, endpoint, params):
+        self.calls.append((endpoint, params))
+        return {"call": len(self.calls)}
+
+    async def _request_async(self, endpoint, params):
+        self.calls.append((endpoint, params))
+        await asyncio.sleep(0.01)
+        return {"call": len(self.calls)}
+
+    def test_fresh_entry_served_from_cache(self):
+        """A second identical request within the TTL does not call the API"""
+        first = cached_request(self._request, "/coins/btc", {"interval": "1d"}, ttl=60)
+        second = cached_request(self._request, "/coins/btc", {"interval": "1d"}, ttl=60)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_force_refresh_refetches(self):
+        """force_refresh skips the cached entry"""
+        cached_request(self._request, "/coins/btc", {}, ttl=60)
+        result = cached_request(self._request, "/coins/btc", {}, ttl=60, force_refresh=True)
+        self.assertEqual(result["call"], 2)
+
+    async def test_concurrent_misses_share_one_request(self):
+        """Identical concurrent async misses issue a single request"""
+        results = await asyncio.gather(
+            *(cached_request_async(self._request_async, "/coins/eth", {"interval": "1h"}, ttl=60)
+              for _ in range(5))
+        )
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(_cache._INFLIGHT, {})
+
+    async def test_failure_is_not_shared_afterwards(self):
+        """A failed in-flight request is dropped so the next call retries"""
+        async def failing(endpoint, params):
+            raise ConnectionError("boom")
+
+        with self.assertRaises(ConnectionError):
+            await cached_request_async(failing, "/coins/sol", {}, ttl=60)
+        result = await cached_request_async(self._request_async, "/coins/sol", {}, ttl=60)
+        self.assertEqual(result["call"], 1)
+
+    async def test_memory_cache_concurrent_misses_share_one_request(self):
+        """Concurrent async misses on the memory cache issue a single request"""
+        _cache.clear_cache()
+        await asyncio.gather(
+            *(memory_cached_request_async(self._request_async, "/topics/eth/news", {}, ttl=60)
+              for _ in range(5))
+        )
+        result = await memory_cached_request_async(self._request_async, "/topics/eth/news", {}, ttl=60)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(result["call"], 1)
+
+
+class TestTTLCache(unittest.TestCase):
+
+    def setUp(self):
+        _cache.clear_cache()
+        self.calls = 0
+
+    def _request(self, endpoint, params):
+        self.calls += 1
+        return {"call": self.calls}
+
+    def test_memory_cache_hit_within_ttl(self):
+        """Identical requests within the TTL are served from memory"""
+        memory_cached_request(self._request, "/topics/bitcoin/news", {"limit": 10}, ttl=60)
+        result = memory_cached_request(self._request, "/topics/bitcoin/news", {"limit": 10}, ttl=60)
+        self.assertEqual(result["call"], 1)
+
+    def test_expired_entry_is_refetched(self):
+        """A zero TTL always calls the API again"""
+        memory_cached_request(self._request, "/topics/bitcoin/news", {}, ttl=0)
+        result = memory_cached_request(self._request, "/topics/bitcoin/news", {}, ttl=0)
+        self.assertEqual(result["call"], 2)
+
+    def test_concurrent_thread_misses_share_one_request(self):
+        """Threads missing the memory cache together issue a single request"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_request(endpoint, params):
+            started.set()
+            release.wait(5)
+            return self._request(endpoint, params)
+
+        with concurrent.futures.ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(memory_cached_request, slow_request, "/topics/sol/news", {}, 60)
+                       for _ in range(4)]
+            started.wait(5)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(r == {"call": 1} for r in results))
+        self.assertEqual(_cache._SYNC_INFLIGHT, {})
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Past maxsize the least recently read entry is dropped"""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        self.assertEqual((cache.get("a"), cache.get("b"), cache.get("c")), (1, None, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -61,8 +61,8 @@ class TestCoinTimeSeriesLunarCrush(unittest.TestCase):
             # This might return an error or empty result depending on API behavior
             self.assertIsInstance(result, dict)
         except Exception as e:
-            # Expected for invalid coins
-            self.assertIsInstance(e, (ConnectionError, ValueError))
+            # Expected for invalid coins, or without an API key
+            self.assertIsInstance(e, (ConnectionError, ValueError, EnvironmentError))
     
     def test_get_coin_time_series_empty_identifier(self):
         """Test with empty coin identifier"""
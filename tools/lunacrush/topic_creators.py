@@ -6,8 +6,8 @@ for a specific topic from the LunarCrush API.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management (optional)
-- os: For accessing environment variables
+- aiohttp: For the *_async variants (optional)
+- python-dotenv: .env loading, done once on the first API call (optional)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
@@ -19,15 +19,32 @@ Usage Example:
     bitcoin_influencers = get_topic_creators("bitcoin", limit=15)
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    pass
+from lunacrush import (make_lunacrush_request, make_lunacrush_request_async, normalize_topic,
+                       topic_endpoint, LunarCrushError)
+from _cache import memory_cached_request, memory_cached_request_async
 
-from lunacrush import make_lunacrush_request
+_VALID_TIME_FRAMES = frozenset(("1h", "6h", "24h", "7d"))
+_VALID_SORT_BY = frozenset(("influence", "engagement", "followers"))
+
+TOPIC_CACHE_TTL = 180  # seconds; influence rankings shift gradually
+
+def _topic_creators_request(topic, limit, time_frame, sort_by):
+    """Validate arguments and return the (endpoint, params) to request."""
+    topic_cleaned = normalize_topic(topic or "")
+    if not topic_cleaned:
+        raise ValueError("topic cannot be empty")
+    
+    if time_frame not in _VALID_TIME_FRAMES:
+        raise ValueError(f"Invalid time_frame: {time_frame}. Must be one of: 1h, 6h, 24h, 7d")
+    if sort_by not in _VALID_SORT_BY:
+        raise ValueError(f"Invalid sort_by: {sort_by}. Must be one of: {sorted(_VALID_SORT_BY)}")
+    
+    params = {
+        "limit": limit,
+        "time_frame": time_frame,
+        "sort_by": sort_by
+    }
+    return topic_endpoint(topic_cleaned, "creators"), params
 
 def get_topic_creators(topic, limit=10, time_frame="24h", sort_by="influence"):
     """
@@ -42,23 +59,21 @@ def get_topic_creators(topic, limit=10, time_frame="24h", sort_by="influence"):
     Returns:
         dict: API response with creator/influencer data
     """
+    endpoint, params = _topic_creators_request(topic, limit, time_frame, sort_by)
     
-    if not topic or not topic.strip():
-        raise ValueError("topic cannot be empty")
-    
-    topic_cleaned = topic.strip().lower()
-    params = {
-        "limit": limit,
-        "time_frame": time_frame,
-        "sort_by": sort_by
-    }
+    try:
+        return memory_cached_request(make_lunacrush_request, endpoint, params, TOPIC_CACHE_TTL)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch topic creators for '{topic}': {e}", e.status) from e
+
+async def get_topic_creators_async(topic, limit=10, time_frame="24h", sort_by="influence"):
+    """Async version of get_topic_creators; shares its validation and in-memory cache."""
+    endpoint, params = _topic_creators_request(topic, limit, time_frame, sort_by)
     
     try:
-        endpoint = f"/topics/{topic_cleaned}/creators"
-        response = make_lunacrush_request(endpoint, params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch topic creators for '{topic}': {str(e)}")
+        return await memory_cached_request_async(make_lunacrush_request_async, endpoint, params, TOPIC_CACHE_TTL)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch topic creators for '{topic}': {e}", e.status) from e
 
 
 if __name__ == "__main__":
@@ -68,16 +83,19 @@ if __name__ == "__main__":
     #   python topic_creators.py --topic bitcoin
     #   python topic_creators.py --topic defi --limit 20 --time_frame 7d --sort_by engagement --output_format csv
     import argparse
-    import json
-    import csv
-    import io
+    import sys
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
     
     parser = argparse.ArgumentParser(description="Fetch topic creators from LunarCrush API")
     parser.add_argument('--topic', required=True, help='Topic to get creators for')
     parser.add_argument('--limit', type=int, default=10, help='Maximum number of creators to return (default: 10)')
     parser.add_argument('--time_frame', default='24h', choices=['1h', '6h', '24h', '7d'], 
                         help='Time frame for analysis (default: 24h)')
-    parser.add_argument('--sort_by', default='influence', choices=['influence', 'engagement', 'followers'], 
+    parser.add_argument('--sort_by', default='influence', choices=sorted(_VALID_SORT_BY), 
                         help='Sort criterion (default: influence)')
     parser.add_argument('--output_format', choices=['json', 'csv'], default='json', help='Output format (default: json)')
     
@@ -89,24 +107,27 @@ if __name__ == "__main__":
         
         # Output in the specified format
         if args.output_format == 'json':
-            print(json.dumps(data, ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                import json
+                json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
+            import csv
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 creators_data = data['data']
                 if isinstance(creators_data, list) and creators_data:
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=creators_data[0].keys())
+                    writer = csv.DictWriter(sys.stdout, fieldnames=creators_data[0].keys(), lineterminator='\n')
                     writer.writeheader()
                     writer.writerows(creators_data)
-                    print(output.getvalue())
                 elif isinstance(creators_data, dict):
                     # Convert single dict to list for CSV output
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=creators_data.keys())
+                    writer = csv.DictWriter(sys.stdout, fieldnames=creators_data.keys(), lineterminator='\n')
                     writer.writeheader()
                     writer.writerow(creators_data)
-                    print(output.getvalue())
                 else:
                     print("No data available")
             else:
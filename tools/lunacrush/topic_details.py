@@ -6,8 +6,8 @@ for a specific topic from the LunarCrush API.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management (optional)
-- os: For accessing environment variables
+- aiohttp: For the *_async variants (optional)
+- python-dotenv: .env loading, done once on the first API call (optional)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
@@ -22,15 +22,26 @@ Usage Example:
     defi_details = get_topic_details("defi")
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    pass
+import functools
+from lunacrush import (make_lunacrush_request, make_lunacrush_request_async, normalize_topic,
+                       topic_endpoint, LunarCrushError)
+from _cache import TTLCache, memory_cached_request, memory_cached_request_async
 
-from lunacrush import make_lunacrush_request
+TOPIC_CACHE_TTL = 300  # seconds; 24h aggregates move slowly
+
+# ETag/Last-Modified validators by request: once the memory entry expires,
+# an unchanged response comes back as a bodiless 304. Bounded, since each
+# entry holds a full response body
+_ETAG_CACHE = TTLCache(maxsize=256)
+
+def _topic_details_request(topic, time_frame):
+    """Validate arguments and return the (endpoint, params) to request."""
+    topic_cleaned = normalize_topic(topic or "")
+    if not topic_cleaned:
+        raise ValueError("topic cannot be empty")
+    
+    params = {"time_frame": time_frame}
+    return topic_endpoint(topic_cleaned, "details"), params
 
 def get_topic_details(topic, time_frame="24h"):
     """
@@ -48,19 +59,25 @@ def get_topic_details(topic, time_frame="24h"):
         EnvironmentError: If LUNA_CRUSH_API_KEY environment variable is not set
         ValueError: If topic is empty
     """
+    endpoint, params = _topic_details_request(topic, time_frame)
     
-    if not topic or not topic.strip():
-        raise ValueError("topic cannot be empty")
+    try:
+        request = functools.partial(make_lunacrush_request, etag_cache=_ETAG_CACHE)
+        return memory_cached_request(request, endpoint, params, TOPIC_CACHE_TTL)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch topic details for '{topic}': {e}", e.status) from e
+
+async def get_topic_details_async(topic, time_frame="24h"):
+    """Async version of get_topic_details; shares its validation and in-memory cache.
     
-    topic_cleaned = topic.strip().lower()
-    params = {"time_frame": time_frame}
+    Unlike the sync version it does not send conditional (ETag) requests.
+    """
+    endpoint, params = _topic_details_request(topic, time_frame)
     
     try:
-        endpoint = f"/topics/{topic_cleaned}/details"
-        response = make_lunacrush_request(endpoint, params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch topic details for '{topic}': {str(e)}")
+        return await memory_cached_request_async(make_lunacrush_request_async, endpoint, params, TOPIC_CACHE_TTL)
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch topic details for '{topic}': {e}", e.status) from e
 
 def get_topic_metrics_summary(topic):
     """Get summarized metrics for a topic."""
@@ -70,6 +87,32 @@ def get_topic_metrics_summary(topic):
     except Exception:
         return {}
 
+async def get_topic_bundle_async(topic):
+    """
+    Fetch details, time series, posts, news and creators for a topic concurrently.
+    
+    The five requests go out together over the shared async session, so the
+    bundle costs roughly one round trip instead of five.
+    
+    Returns:
+        dict: {"details", "time_series", "posts", "news", "creators"} responses
+    """
+    import asyncio
+    from topic_time_series import get_topic_time_series_async
+    from topic_posts import get_topic_posts_async
+    from topic_news import get_topic_news_async
+    from topic_creators import get_topic_creators_async
+    
+    details, time_series, posts, news, creators = await asyncio.gather(
+        get_topic_details_async(topic),
+        get_topic_time_series_async(topic),
+        get_topic_posts_async(topic),
+        get_topic_news_async(topic),
+        get_topic_creators_async(topic),
+    )
+    return {"details": details, "time_series": time_series, "posts": posts,
+            "news": news, "creators": creators}
+
 
 if __name__ == "__main__":
     # This block allows the script to be run directly from the command line.
@@ -78,9 +121,12 @@ if __name__ == "__main__":
     #   python topic_details.py --topic bitcoin
     #   python topic_details.py --topic defi --time_frame 7d --output_format csv
     import argparse
-    import json
-    import csv
-    import io
+    import sys
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
     
     parser = argparse.ArgumentParser(description="Fetch topic details from LunarCrush API")
     parser.add_argument('--topic', required=True, help='Topic to analyze (e.g., bitcoin, defi, nft)')
@@ -95,26 +141,29 @@ if __name__ == "__main__":
         
         # Output in the specified format
         if args.output_format == 'json':
-            print(json.dumps(data, ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                import json
+                json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
+            import csv
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 topic_data = data['data']
                 if isinstance(topic_data, dict):
                     # Convert single dict to list for CSV output
-                    output = io.StringIO()
-                    writer = csv.DictWriter(output, fieldnames=topic_data.keys())
+                    writer = csv.DictWriter(sys.stdout, fieldnames=topic_data.keys(), lineterminator='\n')
                     writer.writeheader()
                     writer.writerow(topic_data)
-                    print(output.getvalue())
                 elif isinstance(topic_data, list):
                     # Handle list of dicts
                     if topic_data:
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=topic_data[0].keys())
+                        writer = csv.DictWriter(sys.stdout, fieldnames=topic_data[0].keys(), lineterminator='\n')
                         writer.writeheader()
                         writer.writerows(topic_data)
-                        print(output.getvalue())
                     else:
                         print("No data available")
                 else:
@@ -6,8 +6,8 @@ over time from the LunarCrush API.
 
 Dependencies:
 - requests: For HTTP API calls  
-- python-dotenv: For environment variable management (optional)
-- os: For accessing environment variables
+- aiohttp: For the *_async variants (optional)
+- python-dotenv: .env loading, done once on the first API call (optional)
 
 Environment Variables Required:
 - LUNA_CRUSH_API_KEY: Your LunarCrush API key (required for API access)
@@ -19,15 +19,33 @@ Usage Example:
     bitcoin_timeseries = get_topic_time_series("bitcoin", data_points=30)
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-    load_dotenv(os.path.join(project_root, '.env'))
-except ImportError:
-    pass
+import functools
+from lunacrush import (make_lunacrush_request, make_lunacrush_request_async, normalize_topic,
+                       topic_endpoint, LunarCrushError)
+from _cache import TTLCache, memory_cached_request, memory_cached_request_async
 
-from lunacrush import make_lunacrush_request
+_VALID_INTERVALS = frozenset(("1h", "1d", "1w"))
+
+# Seconds to cache each interval: coarser buckets close less often
+TOPIC_CACHE_TTLS = {"1h": 300, "1d": 1800, "1w": 7200}
+
+# Conditional-request validators, as in topic_details
+_ETAG_CACHE = TTLCache(maxsize=256)
+
+def _topic_time_series_request(topic, interval, data_points):
+    """Validate arguments and return the (endpoint, params) to request."""
+    topic_cleaned = normalize_topic(topic or "")
+    if not topic_cleaned:
+        raise ValueError("topic cannot be empty")
+    
+    if interval not in _VALID_INTERVALS:
+        raise ValueError(f"Invalid interval: {interval}. Must be one of: 1h, 1d, 1w")
+    
+    params = {
+        "interval": interval,
+        "data_points": data_points
+    }
+    return topic_endpoint(topic_cleaned, "time-series"), params
 
 def get_topic_time_series(topic, interval="1d", data_points=30):
     """
@@ -41,26 +59,25 @@ def get_topic_time_series(topic, interval="1d", data_points=30):
     Returns:
         dict: API response with historical topic metrics
     """
+    endpoint, params = _topic_time_series_request(topic, interval, data_points)
     
-    if not topic or not topic.strip():
-        raise ValueError("topic cannot be empty")
-    
-    valid_intervals = ["1h", "1d", "1w"]
-    if interval not in valid_intervals:
-        raise ValueError(f"Invalid interval: {interval}")
+    try:
+        request = functools.partial(make_lunacrush_request, etag_cache=_ETAG_CACHE)
+        return memory_cached_request(request, endpoint, params, TOPIC_CACHE_TTLS[interval])
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch topic time series for '{topic}': {e}", e.status) from e
+
+async def get_topic_time_series_async(topic, interval="1d", data_points=30):
+    """Async version of get_topic_time_series; shares its validation and in-memory cache.
     
-    topic_cleaned = topic.strip().lower()
-    params = {
-        "interval": interval,
-        "data_points": data_points
-    }
+    Unlike the sync version it does not send conditional (ETag) requests.
+    """
+    endpoint, params = _topic_time_series_request(topic, interval, data_points)
     
     try:
-        endpoint = f"/topics/{topic_cleaned}/time-series"
-        response = make_lunacrush_request(endpoint, params)
-        return response
-    except Exception as e:
-        raise ConnectionError(f"Failed to fetch topic time series for '{topic}': {str(e)}")
+        return await memory_cached_request_async(make_lunacrush_request_async, endpoint, params, TOPIC_CACHE_TTLS[interval])
+    except LunarCrushError as e:
+        raise type(e)(f"Failed to fetch topic time series for '{topic}': {e}", e.status) from e
 
 
 if __name__ == "__main__":
@@ -70,9 +87,12 @@ if __name__ == "__main__":
     #   python topic_time_series.py --topic bitcoin
     #   python topic_time_series.py --topic defi --interval 1h --data_points 24 --output_format csv
     import argparse
-    import json
-    import csv
-    import io
+    import sys
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
     
     parser = argparse.ArgumentParser(description="Fetch topic time series from LunarCrush API")
     parser.add_argument('--topic', required=True, help='Topic to analyze')
@@ -88,37 +108,41 @@ if __name__ == "__main__":
         
         # Output in the specified format
         if args.output_format == 'json':
-            print(json.dumps(data, ensure_ascii=False, indent=2))
+            if ORJSON_AVAILABLE:
+                sys.stdout.buffer.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+            else:
+                import json
+                json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write("\n")
         else:  # csv
+            import csv
             # Handle nested dict structure for CSV output
             if data and 'data' in data:
                 topic_data = data['data']
                 if isinstance(topic_data, dict):
                     # Check if there's a timeSeries array
                     if 'timeSeries' in topic_data and isinstance(topic_data['timeSeries'], list):
-                        if topic_data['timeSeries']:
-                            output = io.StringIO()
-                            writer = csv.DictWriter(output, fieldnames=topic_data['timeSeries'][0].keys())
-                            writer.writeheader()
-                            writer.writerows(topic_data['timeSeries'])
-                            print(output.getvalue())
+                        rows = topic_data['timeSeries']
+                        if rows:
+                            # Positional rows skip DictWriter's per-field dict checks on long series
+                            fields = list(dict.fromkeys(k for row in rows for k in row))
+                            writer = csv.writer(sys.stdout, lineterminator='\n')
+                            writer.writerow(fields)
+                            writer.writerows(tuple(row.get(f) for f in fields) for row in rows)
                         else:
                             print("No time series data available")
                     else:
                         # Convert single dict to list for CSV output
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=topic_data.keys())
+                        writer = csv.DictWriter(sys.stdout, fieldnames=topic_data.keys(), lineterminator='\n')
                         writer.writeheader()
                         writer.writerow(topic_data)
-                        print(output.getvalue())
                 elif isinstance(topic_data, list):
                     # Handle list of dicts
                     if topic_data:
-                        output = io.StringIO()
-                        writer = csv.DictWriter(output, fieldnames=topic_data[0].keys())
+                        writer = csv.DictWriter(sys.stdout, fieldnames=topic_data[0].keys(), lineterminator='\n')
                         writer.writeheader()
                         writer.writerows(topic_data)
-                        print(output.getvalue())
                     else:
                         print("No data available")
                 else: